@@ -1,8 +1,8 @@
 import asyncio
 import os
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
 from pathlib import Path
-from sqlite3 import IntegrityError
 from typing import Any
 
 import pandas as pd
@@ -13,29 +13,31 @@ from dotenv import load_dotenv
 from .core.models import Record
 from .core.store import (
     DB_PATH,
-    batch_insert_filtering_results,
+    bulk_ingest_mode,
     create_filtering_query,
     filter_already_downloaded_records,
     filter_unresolved_records,
+    flush_filtering_batch,
     get_matched_records_by_filtering_query,
     get_pdf_download_stats,
     get_record_provenance,
     get_records,
     get_resolved_candidates,
+    has_records,
     init_db,
-    insert_pdf_resolution,
-    insert_record,
+    insert_pdf_resolutions,
+    insert_records,
+    iter_records,
     record_pdf_download_attempt,
-    update_enrichment_record,
-    update_filtering_query_stats,
+    update_enrichment_records,
 )
-from .enrich.orchestrator import enrich_record, format_enrichment_report
+from .enrich.orchestrator import enrich_records, format_enrichment_report
 from .filter_rank.prompts import filter_records_with_llm
 from .io_.load import load_records
 from .pdfs.download import download_pdf
 from .pdfs.resolve import resolve_pdf_candidates
 from .utils.files import rename_pdf_file
-from .utils.http import RateLimiter
+from .utils.http import RateLimiter, aclose_shared_client
 from .utils.log import get_logger, setup_logging
 from .utils.provenance import formatted_provenance
 
@@ -97,25 +99,34 @@ session_id = _log_state["session_id"]
 
 
 @app.command()
-def import_(path: Path) -> None:
+def import_(
+    path: Path,
+    unsafe_bulk: bool = typer.Option(
+        False,
+        "--unsafe-bulk",
+        help="Skip fsync and the on-disk journal when importing into an empty database. "
+        "Faster, but a crash or Ctrl-C mid-import can corrupt the database file.",
+    ),
+) -> None:
     """Import CSV/XLSX into DB or memory, normalize DOIs."""
-    log.info("import_started", path=str(path))
+    log.info("import_started", path=str(path), unsafe_bulk=unsafe_bulk)
     init_db()
     records = load_records(path)
-    inserted_count = 0
-    skipped_count = 0
-    for rec in records:
-        try:
-            insert_record(rec)
-            inserted_count += 1
-        except IntegrityError as e:
-            if "UNIQUE constraint failed: research_articles.doi_norm" in str(e):
-                log.warning("duplicate_doi_skipped", doi_norm=rec.doi_norm, title=rec.title)
-                typer.echo(f"Skipped duplicate DOI: {rec.doi_norm} (Title: {rec.title})")
-                skipped_count += 1
-            else:
-                # Re-raise other IntegrityErrors if not related to doi_norm
-                raise
+    ingest_mode: AbstractContextManager[None] = nullcontext()
+    if unsafe_bulk:
+        # Only safe when a crash would lose nothing but this import
+        if has_records():
+            log.warning("unsafe_bulk_ignored_database_not_empty")
+            typer.echo("--unsafe-bulk ignored: the database already holds records.")
+        else:
+            ingest_mode = bulk_ingest_mode()
+    with ingest_mode:
+        skipped = insert_records(records)
+    for rec in skipped:
+        log.warning("duplicate_doi_skipped", doi_norm=rec.doi_norm, title=rec.title)
+        typer.echo(f"Skipped duplicate DOI: {rec.doi_norm} (Title: {rec.title})")
+    skipped_count = len(skipped)
+    inserted_count = len(records) - skipped_count
     log.info(
         "import_completed",
         record_count=len(records),
@@ -136,6 +147,11 @@ def enrich(
         True,
         help="Automatically enrich newly discovered published versions in a second pass"
     ),
+    early_exit: bool = typer.Option(
+        False,
+        help="Stop querying abstract sources once one returns an abstract (fewer API calls, "
+        "less provenance for PDF resolution)",
+    ),
 ) -> None:
     """Enrich research articles with abstracts and OA info.
     
@@ -146,8 +162,7 @@ def enrich(
     
     # Helper function to get unenriched records
     def get_unenriched_records() -> list[Record]:
-        all_records = get_records()
-        return [rec for rec in all_records if rec.enrichment_datetime is None]
+        return [rec for rec in iter_records() if rec.enrichment_datetime is None]
     
     # Get initial unenriched records
     records = get_unenriched_records()
@@ -169,8 +184,17 @@ def enrich(
         typer.echo(f"{'='*80}")
         typer.echo(f"\nEnriching {len(batch_records)} records...\n")
         
-        tasks = [enrich_record(rec, clients) for rec in batch_records]
-        enriched = await asyncio.gather(*tasks)
+        try:
+            enriched = await enrich_records(
+                batch_records, clients, max_concurrency=max_workers, early_exit=early_exit
+            )
+        finally:
+            await aclose_shared_client()
+        
+        # Persist the whole pass in one transaction rather than one commit per record
+        for rec in enriched:
+            rec.enrichment_datetime = enrichment_datetime
+        update_enrichment_records(enriched)
         
         # Track newly discovered published versions
         new_published_count = 0
@@ -181,9 +205,6 @@ def enrich(
         typer.echo("="*80 + "\n")
         
         for rec in enriched:
-            rec.enrichment_datetime = enrichment_datetime
-            update_enrichment_record(rec)
-            
             # Check if this record has a newly discovered published version
             if rec.enrichment_report.get("preprint_detection", {}).get("published_version"):
                 pub_version = rec.enrichment_report["preprint_detection"]["published_version"]
@@ -413,7 +434,9 @@ def filter(
 
     for result in filtering_results:
         record_id, match_result, explanation = result
-        batch_data.append((record_id, filtering_query_id, match_result, explanation))
+        batch_data.append(
+            (record_id, filtering_query_id, match_result, explanation, filtering_query_datetime)
+        )
 
         # Count matched records (only those without errors)
         if match_result and not explanation.startswith("ERROR:"):
@@ -427,12 +450,10 @@ def filter(
         if explanation.startswith("WARNING:"):
             warning_count += 1
 
-    # Batch insert filtering results
-    batch_insert_filtering_results(batch_data)
-
-    # Update filtering query statistics
-    update_filtering_query_stats(
+    # Store results and query statistics in a single transaction
+    flush_filtering_batch(
         filtering_query_id=filtering_query_id,
+        results=batch_data,
         total_records=len(records),
         matched_count=matched_count,
         failed_count=failed_count,
@@ -540,17 +561,12 @@ def pdfs(
 
         resolved_count = 0
         no_candidates_count = 0
+        resolutions: list[tuple[int, list[dict], str]] = []
 
         for rec in unresolved_records:
             # Resolve PDF candidates
             candidates = resolve_pdf_candidates(rec)
-
-            # Store resolution in database
-            insert_pdf_resolution(
-                record_id=rec.id,
-                candidates=candidates,
-                resolution_datetime=timestamp,
-            )
+            resolutions.append((rec.id, candidates, timestamp))
 
             if candidates:
                 resolved_count += 1
@@ -564,6 +580,9 @@ def pdfs(
                 no_candidates_count += 1
                 log.debug("no_pdf_candidates", record_id=rec.id, doi=rec.doi_norm)
 
+        # Store all resolutions in one transaction
+        insert_pdf_resolutions(resolutions)
+
         log.info(
             "pdf_resolution_completed",
             total_resolved=resolved_count,
@@ -731,7 +750,10 @@ def pdfs(
                 await download_record_pdf(rec)
 
         tasks = [download_with_semaphore(rec) for rec in records_needing_download]
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await aclose_shared_client()
 
     # Run download processing only for records that need it
     if records_needing_download:
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -49,3 +50,17 @@ class Record(BaseModel):
     
     # Enrichment report (for detailed tracking of enrichment process)
     enrichment_report: dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_row(
+        cls, columns: Sequence[str], values: Sequence[Any], provenance: dict[str, Any]
+    ) -> "Record":
+        """Build a Record from a research_articles row.
+
+        columns names the row's values in order; provenance is passed in already
+        decoded. pydantic's compiled validator converts SQLite's 0/1 booleans and
+        is faster than model_construct, which runs in Python.
+        """
+        data = dict(zip(columns, values, strict=True))
+        data["provenance"] = provenance
+        return cls.model_validate(data)
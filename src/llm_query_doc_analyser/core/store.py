@@ -1,11 +1,21 @@
+import atexit
 import json
+import operator
 import sqlite3
-from collections.abc import Generator
-from contextlib import contextmanager
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager, suppress
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from ..utils.log import get_logger
+
+try:  # optional C-accelerated JSON codec (pip install llm_query_doc_analyser[fast])
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
 from .models import Record  # Ensure the Record class is defined in models.py
 
 log = get_logger(__name__)
@@ -15,7 +25,7 @@ DB_PATH = Path("data/cache/research_articles_management.db")
 
 CREATE_RESEARCH_ARTICLES_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS research_articles (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     title TEXT,
     doi_raw TEXT,
     doi_norm TEXT UNIQUE,
@@ -47,7 +57,7 @@ CREATE TABLE IF NOT EXISTS research_articles (
 
 CREATE_ARTICLE_VERSIONS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS article_versions (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     preprint_id INTEGER NOT NULL,
     published_id INTEGER NOT NULL,
     discovered_at TEXT NOT NULL,
@@ -61,7 +71,7 @@ CREATE TABLE IF NOT EXISTS article_versions (
 
 CREATE_FILTERING_QUERIES_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS filtering_queries (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     filtering_query_datetime TEXT NOT NULL,
     query TEXT NOT NULL,
     exclude_criteria TEXT,
@@ -75,11 +85,13 @@ CREATE TABLE IF NOT EXISTS filtering_queries (
 
 CREATE_RECORDS_FILTERINGS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS records_filterings (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     record_id INTEGER NOT NULL,
     filtering_query_id INTEGER NOT NULL,
     match_result INTEGER NOT NULL,
+    match_status INTEGER NOT NULL DEFAULT 0,
     explanation TEXT,
+    timestamp TEXT,
     FOREIGN KEY (record_id) REFERENCES research_articles(id) ON DELETE CASCADE,
     FOREIGN KEY (filtering_query_id) REFERENCES filtering_queries(id) ON DELETE CASCADE
 );
@@ -87,7 +99,7 @@ CREATE TABLE IF NOT EXISTS records_filterings (
 
 CREATE_PDF_RESOLUTIONS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS pdf_resolutions (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     record_id INTEGER NOT NULL,
     resolution_datetime TEXT NOT NULL,
     candidates TEXT NOT NULL,
@@ -97,7 +109,7 @@ CREATE TABLE IF NOT EXISTS pdf_resolutions (
 
 CREATE_PDF_DOWNLOADS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS pdf_downloads (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     record_id INTEGER NOT NULL,
     download_attempt_datetime TEXT NOT NULL,
     url TEXT NOT NULL,
@@ -113,133 +125,685 @@ CREATE TABLE IF NOT EXISTS pdf_downloads (
 
 CREATE_INDEXES_SQL = [
     "CREATE INDEX IF NOT EXISTS idx_records_filterings_record_id ON records_filterings(record_id);",
-    "CREATE INDEX IF NOT EXISTS idx_records_filterings_filtering_query_id ON records_filterings(filtering_query_id);",
+    # Serves both the matched-records probe and plain filtering_query_id lookups (leftmost
+    # prefix); the trailing record_id makes the matched probe index-only for the join
+    "DROP INDEX IF EXISTS idx_records_filterings_filtering_query_id;",
+    "DROP INDEX IF EXISTS idx_rf_fq_status;",
+    "CREATE INDEX IF NOT EXISTS idx_rf_fq_match ON records_filterings(filtering_query_id, match_result, match_status, record_id);",
     "CREATE INDEX IF NOT EXISTS idx_filtering_queries_datetime ON filtering_queries(filtering_query_datetime);",
-    "CREATE INDEX IF NOT EXISTS idx_pdf_resolutions_record_id ON pdf_resolutions(record_id);",
-    "CREATE INDEX IF NOT EXISTS idx_pdf_downloads_record_id ON pdf_downloads(record_id);",
+    # One resolution and one (latest) download attempt per record; conflict targets for the upserts
+    "DROP INDEX IF EXISTS idx_pdf_resolutions_record_id;",
+    "DROP INDEX IF EXISTS idx_pdf_downloads_record_id;",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_pdf_resolutions_record_id ON pdf_resolutions(record_id);",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_pdf_downloads_record_id ON pdf_downloads(record_id);",
+    # Partial index: only successful downloads, matched by the "already downloaded" probe
+    "CREATE INDEX IF NOT EXISTS idx_pdf_downloads_downloaded ON pdf_downloads(record_id, status) WHERE status = 'downloaded';",
     "CREATE INDEX IF NOT EXISTS idx_pdf_downloads_status ON pdf_downloads(status);",
     "CREATE INDEX IF NOT EXISTS idx_research_articles_is_preprint ON research_articles(is_preprint);",
-    "CREATE INDEX IF NOT EXISTS idx_article_versions_preprint_id ON article_versions(preprint_id);",
-    "CREATE INDEX IF NOT EXISTS idx_article_versions_published_id ON article_versions(published_id);",
+    # preprint_id -> published_id is covered by the UNIQUE(preprint_id, published_id) autoindex;
+    # this is its mirror so get_preprint_version_id never touches the table
+    "DROP INDEX IF EXISTS idx_article_versions_preprint_id;",
+    "DROP INDEX IF EXISTS idx_article_versions_published_id;",
+    "CREATE INDEX IF NOT EXISTS idx_article_versions_published_preprint ON article_versions(published_id, preprint_id);",
 ]
 
+CREATE_SCHEMA_SQL = "\n".join(
+    [
+        CREATE_RESEARCH_ARTICLES_TABLE_SQL,
+        CREATE_ARTICLE_VERSIONS_TABLE_SQL,
+        CREATE_FILTERING_QUERIES_TABLE_SQL,
+        CREATE_RECORDS_FILTERINGS_TABLE_SQL,
+        CREATE_PDF_RESOLUTIONS_TABLE_SQL,
+        CREATE_PDF_DOWNLOADS_TABLE_SQL,
+        *CREATE_INDEXES_SQL,
+    ]
+)
+
+# Hot-path statements are module constants so each connection's statement cache is hit.
+# Record-shaped statements are generated from these column tuples, which also drive the
+# bind-parameter builders below, so SQL and parameters cannot drift apart
+_INSERT_COLUMNS = (
+    "title",
+    "doi_raw",
+    "doi_norm",
+    "pub_date",
+    "total_citations",
+    "citations_per_year",
+    "authors",
+    "source_title",
+    "abstract_text",
+    "abstract_source",
+    "abstract_no_retrieval_reason",
+    "pmid",
+    "arxiv_id",
+    "is_oa",
+    "oa_status",
+    "license",
+    "oa_pdf_url",
+    "provenance",
+    "import_datetime",
+    "is_preprint",
+    "preprint_source",
+    "published_doi",
+    "published_journal",
+    "published_url",
+    "published_fulltext_url",
+)
+
+_ENRICHMENT_COLUMNS = (
+    "abstract_text",
+    "abstract_source",
+    "abstract_no_retrieval_reason",
+    "pmid",
+    "arxiv_id",
+    "is_oa",
+    "oa_status",
+    "license",
+    "oa_pdf_url",
+    "provenance",
+    "enrichment_datetime",
+    "is_preprint",
+    "preprint_source",
+    "published_doi",
+    "published_journal",
+    "published_url",
+    "published_fulltext_url",
+)
+
+INSERT_RESEARCH_ARTICLE_SQL = """
+    INSERT INTO research_articles (
+        {}
+    ) VALUES ({})
+""".format(",\n        ".join(_INSERT_COLUMNS), ", ".join("?" * len(_INSERT_COLUMNS)))
+
+INSERT_RESEARCH_ARTICLES_SKIP_DUPLICATES_SQL = (
+    INSERT_RESEARCH_ARTICLE_SQL + "    ON CONFLICT(doi_norm) DO NOTHING\n"
+)
+
+UPDATE_ENRICHMENT_SQL = """
+    UPDATE research_articles SET
+        {}
+    WHERE doi_norm=?
+""".format(",\n        ".join(f"{col}=?" for col in _ENRICHMENT_COLUMNS))
+
+# import_datetime is set on insert only: an update keeps the original import time
+_UPSERT_UPDATE_COLUMNS = tuple(
+    col for col in _INSERT_COLUMNS if col not in ("doi_norm", "import_datetime")
+)
+
+# The DO UPDATE is skipped when nothing changed, so re-running enrichment on
+# unchanged records does not rewrite their pages
+UPSERT_RESEARCH_ARTICLE_SQL = INSERT_RESEARCH_ARTICLE_SQL + """\
+    ON CONFLICT(doi_norm) DO UPDATE SET
+        {}
+    WHERE {}
+""".format(
+    ",\n        ".join(f"{col}=excluded.{col}" for col in _UPSERT_UPDATE_COLUMNS),
+    "\n        OR ".join(
+        f"research_articles.{col} IS NOT excluded.{col}" for col in _UPSERT_UPDATE_COLUMNS
+    ),
+)
+
+UPSERT_RESEARCH_ARTICLE_RETURNING_ID_SQL = UPSERT_RESEARCH_ARTICLE_SQL + "    RETURNING id\n"
+
+INSERT_FILTERING_QUERY_SQL = """
+    INSERT INTO filtering_queries (
+        filtering_query_datetime, query, exclude_criteria, llm_model, max_concurrent,
+        total_records, matched_count, failed_count
+    ) VALUES (?, ?, ?, ?, ?, 0, 0, 0)
+"""
+
+UPDATE_FILTERING_QUERY_STATS_SQL = """
+    UPDATE filtering_queries
+    SET total_records = ?, matched_count = ?, failed_count = ?
+    WHERE id = ?
+"""
+
+INSERT_FILTERING_RESULT_SQL = """
+    INSERT INTO records_filterings (
+        record_id, filtering_query_id, match_result, match_status, explanation, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+SELECT_RECORD_ID_BY_DOI_SQL = "SELECT id FROM research_articles WHERE doi_norm = ?"
+SELECT_EXISTING_DOIS_SQL = "SELECT doi_norm FROM research_articles WHERE doi_norm IN ({ids})"
+
+# Pinned column order for Record reads: rows come back as plain tuples and are zipped with
+# these names, avoiding sqlite3.Row's per-key name lookups
+RESEARCH_ARTICLE_COLUMNS = (
+    "id",
+    "title",
+    "doi_raw",
+    "doi_norm",
+    "pub_date",
+    "total_citations",
+    "citations_per_year",
+    "authors",
+    "source_title",
+    "abstract_text",
+    "abstract_source",
+    "abstract_no_retrieval_reason",
+    "pmid",
+    "arxiv_id",
+    "is_oa",
+    "oa_status",
+    "license",
+    "oa_pdf_url",
+    "provenance",
+    "import_datetime",
+    "enrichment_datetime",
+    "is_preprint",
+    "preprint_source",
+    "published_doi",
+    "published_journal",
+    "published_url",
+    "published_fulltext_url",
+)
+_PROVENANCE_INDEX = RESEARCH_ARTICLE_COLUMNS.index("provenance")
+
+SELECT_RESEARCH_ARTICLES_SQL = f"SELECT {', '.join(RESEARCH_ARTICLE_COLUMNS)} FROM research_articles"
+
+SELECT_RECORD_BY_DOI_SQL = SELECT_RESEARCH_ARTICLES_SQL + " WHERE doi_norm = ?"
+
+SELECT_MATCHED_RECORDS_SQL = f"""
+    SELECT {", ".join(f"r.{col}" for col in RESEARCH_ARTICLE_COLUMNS)}
+    FROM research_articles r
+    JOIN records_filterings rf ON r.id = rf.record_id
+    WHERE rf.filtering_query_id = ?
+        AND rf.match_result = 1
+        AND rf.match_status = ?
+    ORDER BY rf.record_id  -- same as r.id, but read in order from idx_rf_fq_match
+"""
+
+UPSERT_PDF_RESOLUTION_SQL = """
+    INSERT INTO pdf_resolutions (record_id, resolution_datetime, candidates)
+    VALUES (?, ?, ?)
+    ON CONFLICT(record_id) DO UPDATE SET
+        resolution_datetime=excluded.resolution_datetime,
+        candidates=excluded.candidates
+"""
+
+UPSERT_PDF_DOWNLOAD_SQL = """
+    INSERT INTO pdf_downloads (
+        record_id, download_attempt_datetime, url, source, status,
+        pdf_local_path, sha1, final_url, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(record_id) DO UPDATE SET
+        download_attempt_datetime=excluded.download_attempt_datetime,
+        url=excluded.url,
+        source=excluded.source,
+        status=excluded.status,
+        pdf_local_path=excluded.pdf_local_path,
+        sha1=excluded.sha1,
+        final_url=excluded.final_url,
+        error_message=excluded.error_message
+"""
+
+INSERT_ARTICLE_VERSION_SQL = """
+    INSERT INTO article_versions (
+        preprint_id,
+        published_id,
+        discovered_at,
+        discovery_source,
+        discovery_metadata
+    ) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(preprint_id, published_id) DO NOTHING
+    RETURNING id
+"""
+
+UPSERT_PDF_RESOLUTION_RETURNING_ID_SQL = UPSERT_PDF_RESOLUTION_SQL + "    RETURNING id\n"
+UPSERT_PDF_DOWNLOAD_RETURNING_ID_SQL = UPSERT_PDF_DOWNLOAD_SQL + "    RETURNING id\n"
+
+# Bumped whenever a one-shot data migration is added to _apply_data_migrations
+SCHEMA_VERSION = 2
+
+# records_filterings.match_status values, derived once from the explanation prefix
+MATCH_STATUS_OK = 0
+MATCH_STATUS_ERROR = 1
+MATCH_STATUS_WARNING = 2
+
+# Ids bound per "IN (...)" probe; stays below SQLITE_MAX_VARIABLE_NUMBER on older builds (999)
+_IN_CHUNK_SIZE = 900
+
+
+def _dump_json(value: Any) -> str:
+    """Serialise a value for a JSON TEXT column in compact form (valid for SQLite JSON1)."""
+    if orjson is not None:
+        # Decode so the column keeps TEXT storage class: SQLite >= 3.45 reads BLOB arguments
+        # to json_*() as binary JSONB, which would make text JSON stored as BLOB unreadable
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _load_json(raw: str | bytes) -> Any:
+    """Parse a JSON column value (str, or bytes from legacy BLOB rows).
+
+    Decode errors subclass json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _select_in(conn: sqlite3.Connection, sql: str, ids: list[Any]) -> Iterator[Any]:
+    """Yield rows of sql with its "{ids}" placeholder bound to ids, in chunks under the parameter limit."""
+    for start in range(0, len(ids), _IN_CHUNK_SIZE):
+        chunk = ids[start : start + _IN_CHUNK_SIZE]
+        # Pad to a power of two by repeating an id (a no-op for IN) so each query shape
+        # prepares at most ~10 distinct statements, all served from the statement cache
+        size = min(1 << (len(chunk) - 1).bit_length(), _IN_CHUNK_SIZE)
+        chunk += chunk[-1:] * (size - len(chunk))
+        yield from conn.execute(sql.format(ids=",".join("?" * size)), chunk)
+
+
+def _convert_json(raw: bytes) -> Any:
+    """sqlite3 converter for columns aliased "[JSON]"; empty text reads as None like NULL."""
+    return _load_json(raw) if raw else None
+
+
+sqlite3.register_converter("JSON", _convert_json)
+
+
+def _bint(value: bool | None) -> int | None:
+    """Encode an optional bool as SQLite INTEGER, preserving NULL."""
+    return None if value is None else int(value)
+
+
+def _match_status(explanation: str | None) -> int:
+    """Classify an LLM explanation into a match_status code."""
+    if explanation:
+        if explanation.startswith("ERROR:"):
+            return MATCH_STATUS_ERROR
+        if explanation.startswith("WARNING:"):
+            return MATCH_STATUS_WARNING
+    return MATCH_STATUS_OK
+
+
+def _migrate_records_filterings(conn: sqlite3.Connection) -> None:
+    """Add and backfill records_filterings columns missing from databases created before them."""
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(records_filterings)")}
+    missing = {"match_status", "timestamp"} - cols
+    if not cols or not missing:
+        # Fresh database (table created with the columns) or already migrated
+        return
+    log.info("migrating_records_filterings", columns=sorted(missing))
+    # ALTER does not open an implicit transaction; make the adds + backfills atomic
+    conn.execute("BEGIN IMMEDIATE")
+    if "match_status" in missing:
+        conn.execute(
+            "ALTER TABLE records_filterings ADD COLUMN match_status INTEGER NOT NULL DEFAULT 0"
+        )
+        conn.execute(
+            """
+            UPDATE records_filterings SET match_status = CASE
+                WHEN explanation LIKE 'ERROR:%' THEN ?
+                WHEN explanation LIKE 'WARNING:%' THEN ?
+                ELSE ?
+            END
+            """,
+            (MATCH_STATUS_ERROR, MATCH_STATUS_WARNING, MATCH_STATUS_OK),
+        )
+    if "timestamp" in missing:
+        conn.execute("ALTER TABLE records_filterings ADD COLUMN timestamp TEXT")
+        # Best available value for old rows: the datetime of their filtering session
+        conn.execute(
+            """
+            UPDATE records_filterings SET timestamp = (
+                SELECT fq.filtering_query_datetime FROM filtering_queries fq
+                WHERE fq.id = records_filterings.filtering_query_id
+            )
+            """
+        )
+
+
+def _migrate_provenance_values(conn: sqlite3.Connection) -> None:
+    """Wrap legacy string provenance values as {"raw": value} so readers can assume dicts."""
+    updates = []
+    for record_id, raw in conn.execute(
+        "SELECT id, provenance FROM research_articles WHERE provenance IS NOT NULL"
+    ):
+        try:
+            prov = _load_json(raw)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(prov, dict) or not any(isinstance(v, str) for v in prov.values()):
+            continue
+        prov = {k: {"raw": v} if isinstance(v, str) else v for k, v in prov.items()}
+        updates.append((_dump_json(prov), record_id))
+    if updates:
+        conn.executemany("UPDATE research_articles SET provenance = ? WHERE id = ?", updates)
+    log.info("provenance_values_migrated", updated=len(updates))
+
+
+def _dedupe_per_record_rows(conn: sqlite3.Connection) -> None:
+    """Keep only the latest pdf_resolutions / pdf_downloads row per record before they become unique."""
+    for table in ("pdf_resolutions", "pdf_downloads"):
+        if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone():
+            continue
+        deleted = conn.execute(
+            f"DELETE FROM {table} WHERE id NOT IN (SELECT MAX(id) FROM {table} GROUP BY record_id)"
+        ).rowcount
+        log.info("per_record_rows_deduplicated", table=table, deleted=deleted)
+
+
+def _apply_data_migrations(conn: sqlite3.Connection) -> None:
+    """Run one-shot data migrations tracked by PRAGMA user_version."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-check under the write lock in case another connection migrated first
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        has_articles = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'research_articles'"
+        ).fetchone()
+        if version < 1 and has_articles:
+            _migrate_provenance_values(conn)
+        if version < 2:
+            _dedupe_per_record_rows(conn)
+        if version < SCHEMA_VERSION:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+# Per-connection tuning shared by the writer and reader, applied once when each is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size=-64000",  # ~64 MiB page cache
+    # Large scans read through the OS page cache without copying; address space is cheap
+    "PRAGMA mmap_size=1073741824",  # 1 GiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    # Only takes effect on a new, empty database (it must precede WAL and the first write);
+    # 8 KiB pages hold more provenance JSON per read than the 4 KiB default
+    conn.execute("PRAGMA page_size=8192")
+    # WAL turns each commit into a log append; NORMAL only fsyncs at checkpoints. The mode is
+    # persistent but re-asserted here in case an interrupted bulk_ingest_mode left it OFF
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Truncate the -wal file back to 64 MiB after checkpoints so large batches don't pin disk
+    conn.execute("PRAGMA journal_size_limit=67108864")
+    conn.execute("PRAGMA foreign_keys=ON")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    _apply_data_migrations(conn)
+    return conn
+
+
+# Per-thread connection pool: one writer and one read-only connection, each configured
+# once and reused by every call (sqlite3 connections are not shareable across threads)
+_tls = threading.local()
+
+
+def _thread_conn() -> sqlite3.Connection:
+    """Return this thread's connection to DB_PATH, opening it on first use or path change."""
+    # Identity check: DB_PATH is only ever rebound (e.g. by tests), never mutated, so the
+    # hot path costs no Path comparison; mkdir and PRAGMAs run only in _connect
+    conn: sqlite3.Connection | None = getattr(_tls, "conn", None)
+    if conn is not None and _tls.path is DB_PATH:
+        return conn
+    if conn is not None:
+        conn.close()
+    conn = _connect(DB_PATH)
+    _tls.conn = conn
+    _tls.path = DB_PATH
+    return conn
+
+
+def _thread_read_conn() -> sqlite3.Connection:
+    """Return this thread's read-only connection to DB_PATH, opening it on first use or path change."""
+    conn: sqlite3.Connection | None = getattr(_tls, "read_conn", None)
+    if conn is not None and _tls.read_path is DB_PATH:
+        return conn
+    if conn is not None:
+        conn.close()
+    # Opening the writer first guarantees schema/data migrations have been applied
+    _thread_conn()
+    conn = sqlite3.connect(
+        f"{DB_PATH.resolve().as_uri()}?mode=ro",
+        uri=True,
+        cached_statements=256,
+        # Columns aliased as "name [JSON]" come back already parsed (see _convert_json)
+        detect_types=sqlite3.PARSE_COLNAMES,
+    )
+    conn.execute("PRAGMA query_only=1")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    # Name-addressable rows built in C; they still index and unpack like tuples
+    conn.row_factory = sqlite3.Row
+    _tls.read_conn = conn
+    _tls.read_path = DB_PATH
+    return conn
+
+
+def close_conn() -> None:
+    """Close the calling thread's cached connections, if any."""
+    for attr in ("read_conn", "conn"):
+        conn: sqlite3.Connection | None = getattr(_tls, attr, None)
+        if conn is not None:
+            if attr == "conn":
+                # Recommended before closing a long-lived connection: ANALYZE only the
+                # tables whose statistics this connection's queries found stale (best effort)
+                with suppress(sqlite3.Error):
+                    conn.execute("PRAGMA optimize")
+            conn.close()
+            setattr(_tls, attr, None)
+
+
+atexit.register(close_conn)
+
 
 @contextmanager
 def get_conn() -> Generator[sqlite3.Connection, None, None]:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    """
+    Yield the calling thread's cached connection, committing on success.
+
+    Callers should not commit themselves; the single commit here ends the
+    transaction (implicit, or an explicit BEGIN IMMEDIATE) on success.
+
+    The connection stays open between calls; on error the pending transaction
+    is rolled back. Cursors must not be shared across threads.
+    """
+    conn = _thread_conn()
     try:
-        # Reduce chance of WAL leftovers & enforce FK
-        conn.execute("PRAGMA journal_mode=DELETE")
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.execute("PRAGMA synchronous=FULL")  # or FULL if you prefer stronger durability
-        conn.execute("PRAGMA temp_store=MEMORY")
-        conn.execute("PRAGMA busy_timeout=5000")
         yield conn
         conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+@contextmanager
+def get_read_conn() -> Generator[sqlite3.Connection, None, None]:
+    """
+    Yield the calling thread's cached read-only connection (rows are sqlite3.Row).
+
+    Under WAL, reads on this connection never wait for (or block) writes made
+    through get_conn(). Only committed data is visible.
+    """
+    yield _thread_read_conn()
+
+
+@contextmanager
+def bulk_ingest_mode() -> Generator[None, None, None]:
+    """
+    Keep the rollback journal in memory and skip fsync and FK checks on this
+    thread's connection for a bulk import.
+
+    Trades durability for speed: if the process crashes mid-import the database
+    may be corrupt and the import must be re-run on a fresh file. The in-memory
+    journal still makes ROLLBACK work, so the import is committed only if the
+    body succeeds and rolled back otherwise. WAL,
+    synchronous=NORMAL and foreign keys are restored on exit.
+
+    If the journal mode cannot be switched (e.g. another connection holds the
+    database), the body runs in the normal durable mode instead.
+    """
+    # Leaving WAL needs exclusive access, so drop this thread's reader first
+    read_conn: sqlite3.Connection | None = getattr(_tls, "read_conn", None)
+    if read_conn is not None:
+        read_conn.close()
+        _tls.read_conn = None
+    conn = _thread_conn()
+    conn.commit()
+    mode = conn.execute("PRAGMA journal_mode=MEMORY").fetchone()[0]
+    if mode != "memory":
+        log.warning("bulk_ingest_mode_unavailable", journal_mode=mode)
+        yield
+        return
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA foreign_keys=OFF")
+    log.debug("bulk_ingest_mode_enabled", journal_mode=mode)
+    try:
+        yield
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        log.debug("bulk_ingest_mode_disabled")
 
 
 def init_db() -> None:
     log.info("initializing_database", path=str(DB_PATH))
     with get_conn() as conn:
-        conn.execute(CREATE_RESEARCH_ARTICLES_TABLE_SQL)
-        conn.execute(CREATE_ARTICLE_VERSIONS_TABLE_SQL)
-        conn.execute(CREATE_FILTERING_QUERIES_TABLE_SQL)
-        conn.execute(CREATE_RECORDS_FILTERINGS_TABLE_SQL)
-        conn.execute(CREATE_PDF_RESOLUTIONS_TABLE_SQL)
-        conn.execute(CREATE_PDF_DOWNLOADS_TABLE_SQL)
-        for index_sql in CREATE_INDEXES_SQL:
-            conn.execute(index_sql)
+        # Column migrations must precede the DDL script, whose indexes may reference new columns
+        _migrate_records_filterings(conn)
         conn.commit()
+        conn.executescript(f"BEGIN;\n{CREATE_SCHEMA_SQL}\nCOMMIT;")
+        # Refresh planner statistics when they are missing or stale (cheap otherwise); 0x10000
+        # checks every table, so freshly created indexes are analyzed without prior queries
+        conn.execute("PRAGMA optimize=0x10002")
     log.info("database_initialized", path=str(DB_PATH))
 
 
+# Record attributes stored in a different form than the model holds them
+_COLUMN_ADAPTERS = {"is_oa": _bint, "is_preprint": _bint, "provenance": _dump_json}
+
+
+def _row_builder(columns: tuple[str, ...]) -> Callable[[Record], list[Any]]:
+    """Return a function mapping a Record to bind parameters for columns, in order."""
+    getter = operator.attrgetter(*columns)
+    adapters = [
+        (i, _COLUMN_ADAPTERS[col]) for i, col in enumerate(columns) if col in _COLUMN_ADAPTERS
+    ]
+
+    def build(rec: Record) -> list[Any]:
+        row = list(getter(rec))
+        for i, adapt in adapters:
+            row[i] = adapt(row[i])
+        return row
+
+    return build
+
+
+# Bind parameters for INSERT_RESEARCH_ARTICLE_SQL and the statements built on it
+_to_row = _row_builder(_INSERT_COLUMNS)
+_to_enrichment_row = _row_builder((*_ENRICHMENT_COLUMNS, "doi_norm"))
+
+
 def insert_record(rec: Record) -> int:
     with get_conn() as conn:
+        return conn.execute(INSERT_RESEARCH_ARTICLE_SQL, _to_row(rec)).lastrowid
+
+
+def insert_records(recs: list[Record]) -> list[Record]:
+    """
+    Bulk insert records in a single transaction.
+
+    Records whose doi_norm already exists (in the database or earlier in the
+    batch) are skipped rather than aborting the batch.
+
+    Args:
+        recs: Records to insert
+
+    Returns:
+        The skipped duplicate records, in input order
+    """
+    if not recs:
+        return []
+
+    log.debug("bulk_inserting_records", count=len(recs))
+    with get_conn() as conn:
+        # The write lock is held from here, so the existing DOIs cannot change under us
+        conn.execute("BEGIN IMMEDIATE")
+        dois = list(dict.fromkeys(rec.doi_norm for rec in recs if rec.doi_norm))
+        seen = {row[0] for row in _select_in(conn, SELECT_EXISTING_DOIS_SQL, dois)}
+        to_insert: list[Record] = []
+        skipped: list[Record] = []
+        for rec in recs:
+            if rec.doi_norm in seen:
+                skipped.append(rec)
+                continue
+            if rec.doi_norm:
+                seen.add(rec.doi_norm)
+            to_insert.append(rec)
+        conn.executemany(INSERT_RESEARCH_ARTICLES_SKIP_DUPLICATES_SQL, map(_to_row, to_insert))
+
+    log.info("records_bulk_inserted", inserted=len(to_insert), skipped=len(skipped))
+    return skipped
+
+
+def iter_records() -> Iterator[Record]:
+    """Yield every research article as a Record without materialising the full table."""
+    with get_read_conn() as conn:
         cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO research_articles (
-                title,
-                doi_raw,
-                doi_norm,
-                pub_date,
-                total_citations,
-                citations_per_year,
-                authors,
-                source_title,
-                abstract_text,
-                abstract_source,
-                abstract_no_retrieval_reason,
-                pmid,
-                arxiv_id,
-                is_oa,
-                oa_status,
-                license,
-                oa_pdf_url,
-                provenance,
-                import_datetime,
-                is_preprint,
-                preprint_source,
-                published_doi,
-                published_journal,
-                published_url,
-                published_fulltext_url
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                rec.title,
-                rec.doi_raw,
-                rec.doi_norm,
-                rec.pub_date,
-                rec.total_citations,
-                rec.citations_per_year,
-                rec.authors,
-                rec.source_title,
-                rec.abstract_text,
-                rec.abstract_source,
-                rec.abstract_no_retrieval_reason,
-                rec.pmid,
-                rec.arxiv_id,
-                int(rec.is_oa) if rec.is_oa is not None else None,
-                rec.oa_status,
-                rec.license,
-                rec.oa_pdf_url,
-                json.dumps(rec.provenance),
-                rec.import_datetime,
-                int(rec.is_preprint) if rec.is_preprint is not None else None,
-                rec.preprint_source,
-                rec.published_doi,
-                rec.published_journal,
-                rec.published_url,
-                rec.published_fulltext_url,
-            ),
-        )
-        conn.commit()
-        return cur.lastrowid
+        cur.row_factory = None
+        cur.arraysize = 1000
+        cur.execute(SELECT_RESEARCH_ARTICLES_SQL)
+        # Provenance values are normalised to dicts once by _migrate_provenance_values
+        while rows := cur.fetchmany():
+            for row in rows:
+                yield _record_from_row(row)
+
+
+def _record_from_row(row: tuple[Any, ...]) -> Record:
+    """Build a Record from a row in RESEARCH_ARTICLE_COLUMNS order, decoding its provenance JSON."""
+    raw = row[_PROVENANCE_INDEX]
+    return Record.from_row(RESEARCH_ARTICLE_COLUMNS, row, _load_json(raw) if raw else {})
+
+
+def get_record_by_doi(doi_norm: str) -> Record | None:
+    """
+    Get a record by normalized DOI with a single indexed lookup.
+
+    Args:
+        doi_norm: Normalized DOI
+
+    Returns:
+        Record or None if not found
+    """
+    with get_read_conn() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        row = cur.execute(SELECT_RECORD_BY_DOI_SQL, (doi_norm,)).fetchone()
+    return _record_from_row(row) if row else None
 
 
 def get_records() -> list[Record]:
     log.debug("fetching_records_from_db", path=str(DB_PATH))
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM research_articles")
-        rows = cur.fetchall()
-        cols = [desc[0] for desc in cur.description]
-        records = []
-        for row in rows:
-            data = dict(zip(cols, row, strict=False))
-            data["provenance"] = json.loads(data["provenance"] or "{}")
-            # MIGRATION: ensure all provenance values are dicts (not strings)
-            if isinstance(data["provenance"], dict):
-                for k, v in list(data["provenance"].items()):
-                    if isinstance(v, str):
-                        data["provenance"][k] = {"raw": v}
-            records.append(Record(**data))
-        log.info("records_fetched", count=len(records), path=str(DB_PATH))
-        return records
+    records = list(iter_records())
+    log.info("records_fetched", count=len(records), path=str(DB_PATH))
+    return records
+
+
+def has_records() -> bool:
+    """Return True if research_articles contains at least one row."""
+    with get_read_conn() as conn:
+        return conn.execute("SELECT 1 FROM research_articles LIMIT 1").fetchone() is not None
 
 
 def update_enrichment_record(rec: Record) -> int | None:
@@ -247,185 +811,70 @@ def update_enrichment_record(rec: Record) -> int | None:
     Update record with enrichment. Returns the last inserted row id if available,
     or None for non-insert operations.
     """
-    log.debug("updating enrichment of the record", doi=rec.doi_norm, title=rec.title[:100])
+    log.debug("updating_enrichment_record", doi=rec.doi_norm)
     with get_conn() as conn:
-        cur = conn.cursor()
-        # Try update by doi_norm
-        cur.execute(
-            """
-            UPDATE research_articles SET
-                abstract_text=?,
-                abstract_source=?,
-                abstract_no_retrieval_reason=?,
-                pmid=?,
-                arxiv_id=?,
-                is_oa=?,
-                oa_status=?,
-                license=?,
-                oa_pdf_url=?,
-                provenance=?,
-                enrichment_datetime=?,
-                is_preprint=?,
-                preprint_source=?,
-                published_doi=?,
-                published_journal=?,
-                published_url=?,
-                published_fulltext_url=?
-            WHERE doi_norm=?
-            """,
-            (
-                rec.abstract_text,
-                rec.abstract_source,
-                rec.abstract_no_retrieval_reason,
-                rec.pmid,
-                rec.arxiv_id,
-                int(rec.is_oa) if rec.is_oa is not None else None,
-                rec.oa_status,
-                rec.license,
-                rec.oa_pdf_url,
-                json.dumps(rec.provenance),
-                rec.enrichment_datetime,
-                int(rec.is_preprint) if rec.is_preprint is not None else None,
-                rec.preprint_source,
-                rec.published_doi,
-                rec.published_journal,
-                rec.published_url,
-                rec.published_fulltext_url,
-                rec.doi_norm,
-            ),
-        )
-        conn.commit()
+        # Update by doi_norm
+        cur = conn.execute(UPDATE_ENRICHMENT_SQL, _to_enrichment_row(rec))
         log.debug("record_updated", doi=rec.doi_norm)
         return cur.lastrowid
 
 
+def update_enrichment_records(recs: list[Record]) -> int:
+    """
+    Persist enrichment results for many records in a single transaction.
+
+    Args:
+        recs: Enriched records, matched to stored rows by doi_norm
+
+    Returns:
+        Number of rows updated
+    """
+    if not recs:
+        return 0
+
+    log.debug("bulk_updating_enrichment_records", count=len(recs))
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        updated = conn.executemany(UPDATE_ENRICHMENT_SQL, map(_to_enrichment_row, recs)).rowcount
+
+    log.info("enrichment_records_bulk_updated", count=updated)
+    return updated
+
+
 def upsert_record(rec: Record) -> int | None:
-    """Update if doi_norm exists, else insert."""
-    log.debug("upserting_record", doi=rec.doi_norm, title=rec.title[:100])
+    """Update if doi_norm exists, else insert. Returns the record id in both cases."""
+    log.debug("upserting_record", doi=rec.doi_norm)
     with get_conn() as conn:
-        cur = conn.cursor()
-        # Try update by doi_norm
-        cur.execute(
-            """
-            UPDATE research_articles SET
-                title=?,
-                doi_raw=?,
-                pub_date=?,
-                total_citations=?,
-                citations_per_year=?,
-                authors=?,
-                source_title=?,
-                abstract_text=?,
-                abstract_source=?,
-                abstract_no_retrieval_reason=?,
-                pmid=?,
-                arxiv_id=?,
-                is_oa=?,
-                oa_status=?,
-                license=?,
-                oa_pdf_url=?,
-                provenance=?,
-                is_preprint=?,
-                preprint_source=?,
-                published_doi=?,
-                published_journal=?,
-                published_url=?,
-                published_fulltext_url=?
-            WHERE doi_norm=?
-            """,
-            (
-                rec.title,
-                rec.doi_raw,
-                rec.pub_date,
-                rec.total_citations,
-                rec.citations_per_year,
-                rec.authors,
-                rec.source_title,
-                rec.abstract_text,
-                rec.abstract_source,
-                rec.abstract_no_retrieval_reason,
-                rec.pmid,
-                rec.arxiv_id,
-                int(rec.is_oa) if rec.is_oa is not None else None,
-                rec.oa_status,
-                rec.license,
-                rec.oa_pdf_url,
-                json.dumps(rec.provenance),
-                int(rec.is_preprint) if rec.is_preprint is not None else None,
-                rec.preprint_source,
-                rec.published_doi,
-                rec.published_journal,
-                rec.published_url,
-                rec.published_fulltext_url,
-                rec.doi_norm,
-            ),
-        )
-        if cur.rowcount == 0:
-            # Insert if not found
-            log.debug("inserting_new_record", doi=rec.doi_norm)
-            cur.execute(
-                """
-                INSERT INTO research_articles (
-                    title, 
-                    doi_raw, 
-                    doi_norm, 
-                    pub_date, 
-                    total_citations, 
-                    citations_per_year, 
-                    authors, 
-                    source_title,
-                    abstract_text, 
-                    abstract_source,
-                    abstract_no_retrieval_reason,
-                    pmid, 
-                    arxiv_id,
-                    is_oa, 
-                    oa_status, 
-                    license, 
-                    oa_pdf_url, 
-                    provenance,
-                    is_preprint,
-                    preprint_source,
-                    published_doi,
-                    published_journal,
-                    published_url,
-                    published_fulltext_url
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    rec.title,
-                    rec.doi_raw,
-                    rec.doi_norm,
-                    rec.pub_date,
-                    rec.total_citations,
-                    rec.citations_per_year,
-                    rec.authors,
-                    rec.source_title,
-                    rec.abstract_text,
-                    rec.abstract_source,
-                    rec.abstract_no_retrieval_reason,
-                    rec.pmid,
-                    rec.arxiv_id,
-                    int(rec.is_oa) if rec.is_oa is not None else None,
-                    rec.oa_status,
-                    rec.license,
-                    rec.oa_pdf_url,
-                    json.dumps(rec.provenance),
-                    int(rec.is_preprint) if rec.is_preprint is not None else None,
-                    rec.preprint_source,
-                    rec.published_doi,
-                    rec.published_journal,
-                    rec.published_url,
-                    rec.published_fulltext_url,
-                ),
-            )
-            conn.commit()
-            log.debug("record_inserted", doi=rec.doi_norm, id=cur.lastrowid)
-            return cur.lastrowid
-        else:
-            conn.commit()
-            log.debug("record_updated", doi=rec.doi_norm)
-            return cur.lastrowid
+        row = conn.execute(UPSERT_RESEARCH_ARTICLE_RETURNING_ID_SQL, _to_row(rec)).fetchone()
+        if row is None and rec.doi_norm:
+            # Unchanged existing row: the skipped update returns nothing
+            row = conn.execute(SELECT_RECORD_ID_BY_DOI_SQL, (rec.doi_norm,)).fetchone()
+    record_id = row[0] if row else None
+    log.debug("record_upserted", doi=rec.doi_norm, id=record_id)
+    return record_id
+
+
+def upsert_records(recs: list[Record]) -> int:
+    """
+    Bulk upsert records by doi_norm in a single transaction.
+
+    Args:
+        recs: Records to insert, or to update in place when their doi_norm exists
+
+    Returns:
+        Number of records inserted or changed; unchanged rows are not counted
+    """
+    if not recs:
+        return 0
+
+    log.debug("bulk_upserting_records", count=len(recs))
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        cur = conn.executemany(UPSERT_RESEARCH_ARTICLE_SQL, map(_to_row, recs))
+        upserted = cur.rowcount
+
+    log.info("records_bulk_upserted", count=upserted)
+    return upserted
 
 
 def create_filtering_query(
@@ -456,18 +905,10 @@ def create_filtering_query(
     )
 
     with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO filtering_queries (
-                filtering_query_datetime, query, exclude_criteria, llm_model, max_concurrent,
-                total_records, matched_count, failed_count
-            ) VALUES (?, ?, ?, ?, ?, 0, 0, 0)
-            """,
+        filtering_query_id = conn.execute(
+            INSERT_FILTERING_QUERY_SQL,
             (timestamp, query, exclude_criteria, llm_model, max_concurrent),
-        )
-        conn.commit()
-        filtering_query_id = cur.lastrowid
+        ).lastrowid
 
     log.info(
         "filtering_query_created",
@@ -502,14 +943,9 @@ def update_filtering_query_stats(
 
     with get_conn() as conn:
         conn.execute(
-            """
-            UPDATE filtering_queries 
-            SET total_records = ?, matched_count = ?, failed_count = ?
-            WHERE id = ?
-            """,
+            UPDATE_FILTERING_QUERY_STATS_SQL,
             (total_records, matched_count, failed_count, filtering_query_id),
         )
-        conn.commit()
 
     log.info(
         "filtering_query_stats_updated",
@@ -546,18 +982,33 @@ def insert_filtering_result(
 
     with get_conn() as conn:
         conn.execute(
-            """
-            INSERT INTO records_filterings (
-                record_id, filtering_query_id, match_result, explanation, timestamp
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
-            (record_id, filtering_query_id, int(match_result), explanation, timestamp),
+            INSERT_FILTERING_RESULT_SQL,
+            (
+                record_id,
+                filtering_query_id,
+                int(match_result),
+                _match_status(explanation),
+                explanation,
+                timestamp,
+            ),
         )
-        conn.commit()
+
+
+def _insert_filtering_rows(
+    conn: sqlite3.Connection, results: list[tuple[int, int, bool, str, str]]
+) -> None:
+    """executemany INSERT_FILTERING_RESULT_SQL, encoding rows lazily."""
+    conn.executemany(
+        INSERT_FILTERING_RESULT_SQL,
+        (
+            (record_id, fq_id, int(matched), _match_status(expl), expl, ts)
+            for record_id, fq_id, matched, expl, ts in results
+        ),
+    )
 
 
 def batch_insert_filtering_results(
-    results: list[tuple[int, int, bool, str]],
+    results: list[tuple[int, int, bool, str, str]],
 ) -> None:
     """
     Batch insert filtering results for efficiency.
@@ -571,19 +1022,50 @@ def batch_insert_filtering_results(
     log.debug("batch_inserting_filtering_results", count=len(results))
 
     with get_conn() as conn:
-        conn.executemany(
-            """
-            INSERT INTO records_filterings (
-                record_id, filtering_query_id, match_result, explanation
-            ) VALUES (?, ?, ?, ?)
-            """,
-            [(r[0], r[1], int(r[2]), r[3]) for r in results],
-        )
-        conn.commit()
+        # One explicit write transaction for the whole batch; rows are encoded lazily
+        conn.execute("BEGIN IMMEDIATE")
+        _insert_filtering_rows(conn, results)
 
     log.info("filtering_results_batch_inserted", count=len(results))
 
 
+def flush_filtering_batch(
+    filtering_query_id: int,
+    results: list[tuple[int, int, bool, str, str]],
+    total_records: int,
+    matched_count: int,
+    failed_count: int,
+) -> None:
+    """
+    Insert filtering results and update the query's statistics in one transaction.
+
+    Args:
+        filtering_query_id: ID of the filtering query
+        results: List of tuples (record_id, filtering_query_id, match_result, explanation, timestamp)
+        total_records: Total number of records processed
+        matched_count: Number of records that matched
+        failed_count: Number of records that failed processing
+    """
+    log.debug("flushing_filtering_batch", filtering_query_id=filtering_query_id, count=len(results))
+
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _insert_filtering_rows(conn, results)
+        conn.execute(
+            UPDATE_FILTERING_QUERY_STATS_SQL,
+            (total_records, matched_count, failed_count, filtering_query_id),
+        )
+
+    log.info(
+        "filtering_batch_flushed",
+        filtering_query_id=filtering_query_id,
+        count=len(results),
+        total_records=total_records,
+        matched_count=matched_count,
+        failed_count=failed_count,
+    )
+
+
 def get_filtering_results(filtering_query_id: int) -> list[dict]:
     """
     Retrieve all filtering results for a given filtering query.
@@ -596,11 +1078,11 @@ def get_filtering_results(filtering_query_id: int) -> list[dict]:
     """
     log.debug("fetching_filtering_results", filtering_query_id=filtering_query_id)
 
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         cur = conn.cursor()
         cur.execute(
             """
-            SELECT 
+            SELECT
                 r.id, r.doi_norm, r.title,
                 rf.match_result, rf.explanation, rf.timestamp
             FROM records_filterings rf
@@ -610,9 +1092,7 @@ def get_filtering_results(filtering_query_id: int) -> list[dict]:
             """,
             (filtering_query_id,),
         )
-        rows = cur.fetchall()
-        cols = [desc[0] for desc in cur.description]
-        results = [dict(zip(cols, row, strict=False)) for row in rows]
+        results = [dict(row) for row in cur.fetchall()]
 
     log.info(
         "filtering_results_fetched",
@@ -622,6 +1102,37 @@ def get_filtering_results(filtering_query_id: int) -> list[dict]:
     return results
 
 
+_ID_CACHE_MAXSIZE = 50_000
+# LRU of (db path, doi_norm) -> research_articles.id; record IDs never change once assigned
+_record_id_cache: OrderedDict[tuple[Path, str], int] = OrderedDict()
+# LRUs of (db path, preprint_id) -> published_id and (db path, published_id) -> preprint_id;
+# cleared per key by create_article_version_relation
+_published_id_cache: OrderedDict[tuple[Path, int], int] = OrderedDict()
+_preprint_id_cache: OrderedDict[tuple[Path, int], int] = OrderedDict()
+
+
+def _cached_id_lookup(
+    cache: OrderedDict[tuple[Path, Any], int], key: Any, sql: str
+) -> int | None:
+    """Return the first column of sql's first row for key, memoising hits in an LRU cache."""
+    cache_key = (DB_PATH, key)
+    value = cache.get(cache_key)
+    if value is not None:
+        cache.move_to_end(cache_key)
+        return value
+
+    with get_read_conn() as conn:
+        row = conn.execute(sql, (key,)).fetchone()
+    if row is None:
+        # Misses are not cached: the row may be inserted later in the run
+        return None
+
+    cache[cache_key] = row[0]
+    if len(cache) > _ID_CACHE_MAXSIZE:
+        cache.popitem(last=False)
+    return row[0]
+
+
 def get_record_id_by_doi(doi_norm: str) -> int | None:
     """
     Get record ID by normalized DOI.
@@ -632,11 +1143,32 @@ def get_record_id_by_doi(doi_norm: str) -> int | None:
     Returns:
         Record ID or None if not found
     """
-    with get_conn() as conn:
+    return _cached_id_lookup(_record_id_cache, doi_norm, SELECT_RECORD_ID_BY_DOI_SQL)
+
+
+def invalidate_doi(doi_norm: str | None) -> None:
+    """Drop a cached DOI -> record ID mapping for the current database."""
+    if doi_norm:
+        _record_id_cache.pop((DB_PATH, doi_norm), None)
+
+
+def iter_matched_records_by_filtering_query(filtering_query_id: int) -> Iterator[Record]:
+    """
+    Yield matched records from a filtering query (excluding errors and warnings) in id order.
+
+    Rows are fetched in batches, so only one batch is held in memory at a time.
+
+    Args:
+        filtering_query_id: ID of the filtering query
+    """
+    with get_read_conn() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT id FROM research_articles WHERE doi_norm = ?", (doi_norm,))
-        row = cur.fetchone()
-        return row[0] if row else None
+        cur.row_factory = None
+        cur.arraysize = 1000
+        cur.execute(SELECT_MATCHED_RECORDS_SQL, (filtering_query_id, MATCH_STATUS_OK))
+        while rows := cur.fetchmany():
+            for row in rows:
+                yield _record_from_row(row)
 
 
 def get_matched_records_by_filtering_query(filtering_query_id: int) -> list[Record]:
@@ -650,31 +1182,7 @@ def get_matched_records_by_filtering_query(filtering_query_id: int) -> list[Reco
         List of Record objects that matched
     """
     log.debug("fetching_matched_records", filtering_query_id=filtering_query_id)
-
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT r.* FROM research_articles r
-            JOIN records_filterings rf ON r.id = rf.record_id
-            WHERE rf.filtering_query_id = ?
-                AND rf.match_result = 1
-                AND rf.explanation NOT LIKE 'ERROR:%'
-                AND rf.explanation NOT LIKE 'WARNING:%'
-            ORDER BY r.id
-            """,
-            (filtering_query_id,),
-        )
-        rows = cur.fetchall()
-        cols = [desc[0] for desc in cur.description]
-        records = []
-        for row in rows:
-            data = dict(zip(cols, row, strict=False))
-            # Parse JSON fields
-            if data.get("provenance"):
-                data["provenance"] = json.loads(data["provenance"])
-            records.append(Record(**data))
-
+    records = list(iter_matched_records_by_filtering_query(filtering_query_id))
     log.info(
         "matched_records_fetched",
         filtering_query_id=filtering_query_id,
@@ -693,29 +1201,26 @@ def get_record_provenance(record_id: int) -> dict[Any, Any]:
         A dictionary representing provenance (empty dict if none found)
     """
     log.debug("fetching_record_provenance", record_id=record_id)
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT provenance FROM research_articles WHERE id = ?", (record_id,))
-        row = cur.fetchone()
-        if not row or not row[0]:
-            log.info("provenance_not_found", record_id=record_id)
-            return {}
+    with get_read_conn() as conn:
         try:
-            prov = json.loads(row[0])
-            # If the parsed provenance is not a dict, return an empty dict to match the declared return type
-            if not isinstance(prov, dict):
-                log.warning(
-                    "provenance_not_a_dict", record_id=record_id, value_type=type(prov).__name__
-                )
-                return {}
-            # Ensure values are dicts
-            for k, v in list(prov.items()):
-                if isinstance(v, str):
-                    prov[k] = {"raw": v}
-            return prov
-        except Exception as e:
+            # Decoded by the JSON converter while the row is fetched
+            row = conn.execute(
+                'SELECT provenance AS "provenance [JSON]" FROM research_articles WHERE id = ?',
+                (record_id,),
+            ).fetchone()
+        except json.JSONDecodeError as e:
             log.error("provenance_parse_error", record_id=record_id, error=str(e))
             return {}
+    if not row or row[0] is None:
+        log.info("provenance_not_found", record_id=record_id)
+        return {}
+    prov = row[0]
+    # If the parsed provenance is not a dict, return an empty dict to match the declared return type
+    if not isinstance(prov, dict):
+        log.warning("provenance_not_a_dict", record_id=record_id, value_type=type(prov).__name__)
+        return {}
+    # Legacy string values were wrapped as {"raw": value} once by _migrate_provenance_values
+    return prov
 
 
 def filter_unresolved_records(records: list[Record]) -> list[Record]:
@@ -724,35 +1229,39 @@ def filter_unresolved_records(records: list[Record]) -> list[Record]:
     Records with empty candidate lists will NOT be skipped (they will be re-resolved).
     """
     log.debug("filter_unresolved_records_start", total_input=len(records))
-    with get_conn() as conn:
-        cursor = conn.cursor()
-        unresolved = []
-        checked = 0
-        skipped = 0
-        for rec in records:
-            checked += 1
-            cursor.execute("SELECT candidates FROM pdf_resolutions WHERE record_id = ?", (rec.id,))
-            row = cursor.fetchone()
-            if row and row[0]:
-                try:
-                    candidates = json.loads(row[0])
-                    if candidates:  # If candidates list is not empty
-                        skipped += 1
-                        log.debug(
-                            "record_skipped_already_resolved",
-                            record_id=rec.id,
-                            candidate_count=len(candidates),
-                        )
-                        continue  # Already resolved with candidates, skip
-                except json.JSONDecodeError:
-                    log.warning("invalid_candidates_json_for_record", record_id=rec.id)
-                    # If invalid JSON, treat as not resolved
-            unresolved.append(rec)
+    ids = [rec.id for rec in records if rec.id is not None]
+    resolved: set[int] = set()
+    with get_read_conn() as conn:
+        # Count candidates inside SQLite's JSON1 parser instead of building Python objects;
+        # candidate_count is NULL for invalid JSON
+        for record_id, candidate_count in _select_in(
+            conn,
+            """
+            SELECT
+                record_id,
+                CASE WHEN json_valid(candidates) THEN json_array_length(candidates) END
+            FROM pdf_resolutions
+            WHERE record_id IN ({ids}) AND candidates != ''
+            """,
+            ids,
+        ):
+            if candidate_count is None:
+                log.warning("invalid_candidates_json_for_record", record_id=record_id)
+                # If invalid JSON, treat as not resolved
+                continue
+            if candidate_count:  # If candidates list is not empty
+                resolved.add(record_id)
+                log.debug(
+                    "record_skipped_already_resolved",
+                    record_id=record_id,
+                    candidate_count=candidate_count,
+                )
 
+    unresolved = [rec for rec in records if rec.id not in resolved]
     log.info(
         "filter_unresolved_records_completed",
-        total_checked=checked,
-        total_skipped=skipped,
+        total_checked=len(records),
+        total_skipped=len(records) - len(unresolved),
         total_unresolved=len(unresolved),
     )
     return unresolved
@@ -768,33 +1277,31 @@ def get_resolved_candidates(record_id: int) -> list[dict]:
     Returns:
         List of PDF candidate dictionaries, or empty list if no resolution found
     """
-    with get_conn() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT candidates 
-            FROM pdf_resolutions 
-            WHERE record_id = ? 
-            """,
-            (record_id,),
+    with get_read_conn() as conn:
+        try:
+            row = conn.execute(
+                """
+                SELECT candidates AS "candidates [JSON]"
+                FROM pdf_resolutions
+                WHERE record_id = ?
+                """,
+                (record_id,),
+            ).fetchone()
+        except json.JSONDecodeError:
+            log.warning("invalid_candidates_json_for_record", record_id=record_id)
+            return []
+
+    if row and row[0]:
+        candidates = row[0]
+        log.debug(
+            "resolved_candidates_retrieved",
+            record_id=record_id,
+            candidate_count=len(candidates),
         )
-        row = cursor.fetchone()
+        return candidates
 
-        if row and row[0]:
-            try:
-                candidates = json.loads(row[0])
-                log.debug(
-                    "resolved_candidates_retrieved",
-                    record_id=record_id,
-                    candidate_count=len(candidates),
-                )
-                return candidates
-            except json.JSONDecodeError:
-                log.warning("invalid_candidates_json_for_record", record_id=record_id)
-                return []
-
-        log.debug("no_resolved_candidates_found", record_id=record_id)
-        return []
+    log.debug("no_resolved_candidates_found", record_id=record_id)
+    return []
 
 
 def insert_pdf_resolution(
@@ -809,59 +1316,25 @@ def insert_pdf_resolution(
     Args:
         record_id: ID of the record
         candidates: List of PDF candidate dictionaries
-        timestamp: ISO format timestamp
+        resolution_datetime: ISO format timestamp
 
     Returns:
         ID of the inserted or updated resolution record
     """
     with get_conn() as conn:
-        cur = conn.cursor()
-        
-        # Check if resolution already exists for this record
-        cur.execute(
-            "SELECT id FROM pdf_resolutions WHERE record_id = ?",
-            (record_id,)
-        )
-        existing_row = cur.fetchone()
-        
-        if existing_row:
-            # Update existing resolution
-            resolution_id = existing_row[0]
-            cur.execute(
-                """
-                UPDATE pdf_resolutions 
-                SET resolution_datetime = ?, candidates = ?
-                WHERE id = ?
-                """,
-                (resolution_datetime, json.dumps(candidates), resolution_id),
-            )
-            conn.commit()
-            log.debug(
-                "pdf_resolution_updated",
-                resolution_id=resolution_id,
-                record_id=record_id,
-                candidate_count=len(candidates),
-            )
-        else:
-            # Insert new resolution
-            cur.execute(
-                """
-                INSERT INTO pdf_resolutions 
-                (record_id, resolution_datetime, candidates)
-                VALUES (?, ?, ?)
-                """,
-                (record_id, resolution_datetime, json.dumps(candidates)),
-            )
-            resolution_id = cur.lastrowid
-            conn.commit()
-            log.debug(
-                "pdf_resolution_inserted",
-                resolution_id=resolution_id,
-                record_id=record_id,
-                candidate_count=len(candidates),
-            )
-        
-        return resolution_id
+        row = conn.execute(
+            UPSERT_PDF_RESOLUTION_RETURNING_ID_SQL,
+            (record_id, resolution_datetime, _dump_json(candidates)),
+        ).fetchone()
+
+    resolution_id = row[0]
+    log.debug(
+        "pdf_resolution_stored",
+        resolution_id=resolution_id,
+        record_id=record_id,
+        candidate_count=len(candidates),
+    )
+    return resolution_id
 
 
 def record_pdf_download_attempt(
@@ -894,138 +1367,133 @@ def record_pdf_download_attempt(
         ID of the inserted or updated download record
     """
     with get_conn() as conn:
-        cur = conn.cursor()
-        
-        # Check if download attempt already exists for this record
-        cur.execute(
-            "SELECT id FROM pdf_downloads WHERE record_id = ? ORDER BY id DESC LIMIT 1",
-            (record_id,)
+        row = conn.execute(
+            UPSERT_PDF_DOWNLOAD_RETURNING_ID_SQL,
+            (
+                record_id,
+                download_attempt_datetime,
+                url,
+                source,
+                status,
+                pdf_local_path,
+                sha1,
+                final_url,
+                error_message,
+            ),
+        ).fetchone()
+
+    download_id = row[0]
+    log.debug(
+        "pdf_download_trial_stored",
+        download_id=download_id,
+        record_id=record_id,
+        status=status,
+    )
+    return download_id
+
+
+def insert_pdf_resolutions(rows: list[tuple[int, list[dict], str]]) -> None:
+    """
+    Store or update PDF resolution candidates for many records in one transaction.
+
+    Args:
+        rows: List of tuples (record_id, candidates, resolution_datetime)
+    """
+    if not rows:
+        return
+
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            UPSERT_PDF_RESOLUTION_SQL,
+            (
+                (record_id, resolution_datetime, _dump_json(candidates))
+                for record_id, candidates, resolution_datetime in rows
+            ),
         )
-        existing_row = cur.fetchone()
-        
-        if existing_row:
-            # Update existing download attempt
-            download_id = existing_row[0]
-            cur.execute(
-                """
-                UPDATE pdf_downloads 
-                SET download_attempt_datetime = ?, url = ?, source = ?, status = ?,
-                    pdf_local_path = ?, sha1 = ?, final_url = ?, error_message = ?
-                WHERE id = ?
-                """,
-                (
-                    download_attempt_datetime,
-                    url,
-                    source,
-                    status,
-                    pdf_local_path,
-                    sha1,
-                    final_url,
-                    error_message,
-                    download_id,
-                ),
-            )
-            conn.commit()
-            log.debug(
-                "pdf_download_trial_updated",
-                download_id=download_id,
-                record_id=record_id,
-                status=status,
-            )
-        else:
-            # Insert new download attempt
-            cur.execute(
-                """
-                INSERT INTO pdf_downloads 
-                (record_id, download_attempt_datetime, url, source, status,
-                 pdf_local_path, sha1, final_url, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record_id,
-                    download_attempt_datetime,
-                    url,
-                    source,
-                    status,
-                    pdf_local_path,
-                    sha1,
-                    final_url,
-                    error_message,
-                ),
-            )
-            download_id = cur.lastrowid
-            conn.commit()
-            log.debug(
-                "pdf_download_trial_inserted",
-                download_id=download_id,
-                record_id=record_id,
-                status=status,
-            )
-        
-        return download_id
+
+    log.info("pdf_resolutions_batch_stored", count=len(rows))
+
+
+def record_pdf_download_attempts(
+    rows: list[tuple[int, str, str, str, str, str | None, str | None, str | None, str | None]],
+) -> None:
+    """
+    Store or update many PDF download attempt results in one transaction.
+
+    Args:
+        rows: List of tuples (record_id, url, source, status, download_attempt_datetime,
+            pdf_local_path, sha1, final_url, error_message)
+    """
+    if not rows:
+        return
+
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            UPSERT_PDF_DOWNLOAD_SQL,
+            (
+                (record_id, attempt_dt, url, source, status, path, sha1, final_url, error)
+                for record_id, url, source, status, attempt_dt, path, sha1, final_url, error in rows
+            ),
+        )
+
+    log.info("pdf_download_attempts_batch_stored", count=len(rows))
 
 
 def create_article_version_relation(
     preprint_id: int,
     published_id: int,
     discovery_source: str,
-    discovery_metadata: dict[str, Any] | None = None
+    discovery_metadata: dict[str, Any] | None = None,
+    discovered_at: str | None = None,
 ) -> int | None:
     """Create a relation between a preprint and its published version.
-    
+
     Args:
         preprint_id: ID of the preprint record
-        published_id: ID of the published version record  
+        published_id: ID of the published version record
         discovery_source: API source that provided the version info (e.g., 'crossref')
         discovery_metadata: Optional metadata about the discovery
-        
+        discovered_at: ISO 8601 timestamp; computed now when omitted (pass one per batch)
+
     Returns:
         ID of the created relation, or None if already exists or error
     """
-    from datetime import UTC, datetime
-    
     log.debug(
         "creating_article_version_relation",
         preprint_id=preprint_id,
         published_id=published_id,
         discovery_source=discovery_source
     )
-    
+
     with get_conn() as conn:
-        cur = conn.cursor()
-        
-        # Check if relation already exists
-        cur.execute(
-            "SELECT id FROM article_versions WHERE preprint_id = ? AND published_id = ?",
-            (preprint_id, published_id)
-        )
-        existing = cur.fetchone()
-        if existing:
-            log.debug("article_version_relation_exists", relation_id=existing[0])
-            return existing[0]
-        
-        # Insert new relation
         try:
-            cur.execute(
-                """
-                INSERT INTO article_versions (
-                    preprint_id,
-                    published_id,
-                    discovered_at,
-                    discovery_source,
-                    discovery_metadata
-                ) VALUES (?, ?, ?, ?, ?)
-                """,
+            # Common path is a new pair: one statement inserts and returns the id
+            row = conn.execute(
+                INSERT_ARTICLE_VERSION_SQL,
                 (
                     preprint_id,
                     published_id,
-                    datetime.now(UTC).isoformat(),
+                    discovered_at or datetime.now(UTC).isoformat(),
                     discovery_source,
-                    json.dumps(discovery_metadata or {})
+                    _dump_json(discovery_metadata or {})
                 )
-            )
+            ).fetchone()
+            if row is None:
+                # Insert ignored by UNIQUE(preprint_id, published_id): relation already exists
+                relation_id = conn.execute(
+                    "SELECT id FROM article_versions WHERE preprint_id = ? AND published_id = ?",
+                    (preprint_id, published_id)
+                ).fetchone()[0]
+                log.debug("article_version_relation_exists", relation_id=relation_id)
+                return relation_id
+            # Commit before invalidating so no reader can re-cache the pre-insert state
             conn.commit()
-            relation_id = cur.lastrowid
+            relation_id = row[0]
+            # A new pair can change which id the single-row version lookups return
+            _published_id_cache.pop((DB_PATH, preprint_id), None)
+            _preprint_id_cache.pop((DB_PATH, published_id), None)
             log.info(
                 "article_version_relation_created",
                 relation_id=relation_id,
@@ -1046,59 +1514,54 @@ def create_article_version_relation(
 
 def get_published_version_id(preprint_id: int) -> int | None:
     """Get the published version ID for a given preprint ID.
-    
+
     Args:
         preprint_id: ID of the preprint record
-        
+
     Returns:
         ID of the published version, or None if not found
     """
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT published_id FROM article_versions WHERE preprint_id = ?",
-            (preprint_id,)
-        )
-        result = cur.fetchone()
-        return result[0] if result else None
+    return _cached_id_lookup(
+        _published_id_cache,
+        preprint_id,
+        "SELECT published_id FROM article_versions WHERE preprint_id = ?",
+    )
 
 
 def get_preprint_version_id(published_id: int) -> int | None:
     """Get the preprint version ID for a given published article ID.
-    
+
     Args:
         published_id: ID of the published article record
-        
+
     Returns:
         ID of the preprint version, or None if not found
     """
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT preprint_id FROM article_versions WHERE published_id = ?",
-            (published_id,)
-        )
-        result = cur.fetchone()
-        return result[0] if result else None
+    return _cached_id_lookup(
+        _preprint_id_cache,
+        published_id,
+        "SELECT preprint_id FROM article_versions WHERE published_id = ?",
+    )
 
 
-def get_article_version_relations() -> list[dict[str, Any]]:
-    """Get all article version relations.
-    
-    Returns:
-        List of relation dictionaries with all fields
+def iter_article_version_relations() -> Iterator[dict[str, Any]]:
+    """Yield article version relations one at a time, fetching rows in batches.
+
+    Yields:
+        Relation dictionaries with all fields
     """
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         cur = conn.cursor()
+        cur.arraysize = 1000
         cur.execute(
             """
-            SELECT 
+            SELECT
                 av.id,
                 av.preprint_id,
                 av.published_id,
                 av.discovered_at,
                 av.discovery_source,
-                av.discovery_metadata,
+                av.discovery_metadata AS "discovery_metadata [JSON]",
                 r1.doi_norm as preprint_doi,
                 r1.title as preprint_title,
                 r2.doi_norm as published_doi,
@@ -1108,76 +1571,70 @@ def get_article_version_relations() -> list[dict[str, Any]]:
             JOIN research_articles r2 ON av.published_id = r2.id
             """
         )
-        rows = cur.fetchall()
-        cols = [desc[0] for desc in cur.description]
-        
-        relations = []
-        for row in rows:
-            data = dict(zip(cols, row, strict=False))
-            data['discovery_metadata'] = json.loads(data.get('discovery_metadata') or '{}')
-            relations.append(data)
-        
-        return relations
+        while rows := cur.fetchmany():
+            for row in rows:
+                data = dict(row)
+                data["discovery_metadata"] = data["discovery_metadata"] or {}
+                yield data
+
+
+def get_article_version_relations() -> list[dict[str, Any]]:
+    """Get all article version relations.
+
+    Returns:
+        List of relation dictionaries with all fields
+    """
+    return list(iter_article_version_relations())
 
 
 def get_version_linking_stats() -> dict[str, Any]:
     """Get statistics on pre-print ↔ published version linking.
-    
+
     Returns:
         Dictionary with linking statistics
     """
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         cursor = conn.cursor()
-        
-        # Count total preprints
-        cursor.execute("SELECT COUNT(*) FROM research_articles WHERE is_preprint = 1")
-        total_preprints = cursor.fetchone()[0]
-        
-        # Count preprints with published versions (via relation table)
-        cursor.execute(
-            """
-            SELECT COUNT(DISTINCT preprint_id) 
-            FROM article_versions
-            """
-        )
-        preprints_with_published = cursor.fetchone()[0]
-        
-        # Count published articles with preprint versions (via relation table)
+
+        # Scalar counts in one round trip: total preprints, preprints with a published
+        # version and published articles with a preprint (the latter two via the relation table)
         cursor.execute(
             """
-            SELECT COUNT(DISTINCT published_id) 
-            FROM article_versions
+            SELECT
+                (SELECT COUNT(*) FROM research_articles WHERE is_preprint = 1),
+                (SELECT COUNT(DISTINCT preprint_id) FROM article_versions),
+                (SELECT COUNT(DISTINCT published_id) FROM article_versions)
             """
         )
-        published_with_preprint = cursor.fetchone()[0]
-        
+        total_preprints, preprints_with_published, published_with_preprint = cursor.fetchone()
+
         # Count by preprint source
         cursor.execute(
             """
-            SELECT preprint_source, COUNT(*) 
-            FROM research_articles 
-            WHERE is_preprint = 1 
+            SELECT preprint_source, COUNT(*)
+            FROM research_articles
+            WHERE is_preprint = 1
             GROUP BY preprint_source
             """
         )
-        by_source = dict(cursor.fetchall())
-        
+        by_source = dict(cursor)
+
         # Count by version discovery source
         cursor.execute(
             """
-            SELECT discovery_source, COUNT(*) 
-            FROM article_versions 
+            SELECT discovery_source, COUNT(*)
+            FROM article_versions
             GROUP BY discovery_source
             """
         )
-        by_discovery_source = dict(cursor.fetchall())
+        by_discovery_source = dict(cursor)
 
     return {
         "total_preprints": total_preprints,
         "preprints_with_published_version": preprints_with_published,
         "published_with_preprint_version": published_with_preprint,
         "linking_rate": (
-            preprints_with_published / total_preprints * 100 
+            preprints_with_published / total_preprints * 100
             if total_preprints > 0 else 0
         ),
         "by_preprint_source": by_source,
@@ -1195,7 +1652,7 @@ def get_pdf_download_stats(filtering_query_id: int | None = None) -> dict:
     Returns:
         Dictionary with status counts
     """
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         cur = conn.cursor()
         if filtering_query_id:
             cur.execute(
@@ -1216,56 +1673,52 @@ def get_pdf_download_stats(filtering_query_id: int | None = None) -> dict:
                 GROUP BY status
                 """
             )
-        rows = cur.fetchall()
-        return {row[0]: row[1] for row in rows}
+        return dict(cur)
 
 
 def filter_already_downloaded_records(records: list[Record]) -> list[Record]:
     """
     Filter records to exclude those already successfully downloaded.
     Records with failed or no download attempts will NOT be skipped (they will be re-attempted).
-    
+
     Args:
         records: List of records to check
-        
+
     Returns:
         List of records that haven't been successfully downloaded yet
     """
     log.debug("filter_already_downloaded_records_start", total_input=len(records))
-    with get_conn() as conn:
-        cursor = conn.cursor()
-        records_needing_download = []
-        checked = 0
-        skipped = 0
-        
-        for rec in records:
-            checked += 1
-            cursor.execute(
+    ids = [rec.id for rec in records if rec.id is not None]
+    with get_read_conn() as conn:
+        downloaded = {
+            row[0]
+            for row in _select_in(
+                conn,
                 """
-                SELECT COUNT(*) 
-                FROM pdf_downloads 
-                WHERE record_id = ? AND status = 'downloaded'
+                SELECT record_id
+                FROM pdf_downloads
+                WHERE status = 'downloaded' AND record_id IN ({ids})
                 """,
-                (rec.id,)
+                ids,
             )
-            row = cursor.fetchone()
-            
-            if row and row[0] > 0:
-                # Record already has a successful download
-                skipped += 1
-                log.debug(
-                    "record_skipped_already_downloaded",
-                    record_id=rec.id,
-                    doi=rec.doi_norm,
-                )
-                continue
-            
-            records_needing_download.append(rec)
-    
+        }
+
+    records_needing_download = []
+    for rec in records:
+        if rec.id in downloaded:
+            # Record already has a successful download
+            log.debug(
+                "record_skipped_already_downloaded",
+                record_id=rec.id,
+                doi=rec.doi_norm,
+            )
+            continue
+        records_needing_download.append(rec)
+
     log.info(
         "filter_already_downloaded_records_completed",
-        total_checked=checked,
-        total_skipped=skipped,
+        total_checked=len(records),
+        total_skipped=len(records) - len(records_needing_download),
         total_needing_download=len(records_needing_download),
     )
     return records_needing_download
@@ -10,7 +10,9 @@ from ..utils.log import get_logger
 
 log = get_logger(__name__)
 
-ARXIV_ID_PATTERN = re.compile(r"arxiv:(\d{4}\.\d{4,5})(v\d+)?", re.IGNORECASE)
+# arXiv identifier in a DOI-like string: "arxiv:2101.00001" or, anywhere via .search,
+# the DataCite form "10.48550/arxiv.2101.00001". Shared by every arXiv ID lookup.
+ARXIV_DOI_PATTERN = re.compile(r"arxiv[:\.](\d{4}\.\d{4,5})(v\d+)?", re.IGNORECASE)
 
 
 async def fetch_arxiv(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -22,7 +24,7 @@ async def fetch_arxiv(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
     arxiv_id = rec.arxiv_id
     # Fallback: try to extract from DOI if not set
     if not arxiv_id and rec.doi_norm:
-        m = ARXIV_ID_PATTERN.match(rec.doi_norm)
+        m = ARXIV_DOI_PATTERN.match(rec.doi_norm)
         if m:
             arxiv_id = m.group(1)
     
@@ -80,7 +82,7 @@ async def fetch_arxiv(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
         
         # Normalize abstract text
         if abstract:
-            abstract = re.sub(r"\s+", " ", abstract.replace("\n", " ")).strip()
+            abstract = " ".join(abstract.split())
         
         provenance = {
             "xml": xml,
@@ -1,15 +1,44 @@
 import re
 import xml.etree.ElementTree as ET
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 
+from ..core.hashing import normalize_doi
 from ..core.models import Record
-from ..utils.http import get_with_retry
+from ..utils.http import get_with_retry, response_json
 from ..utils.log import get_logger
 
 log = get_logger(__name__)
 
+TAG_RE = re.compile(r"<[^>]+>")
+
+# DOIs per works?filter=doi:... request in fetch_crossref_batch
+CROSSREF_BATCH_SIZE = 50
+
+
+def _parse_crossref_message(message: dict[str, Any]) -> tuple[str | None, str | None]:
+    """Return the cleaned abstract and first PDF link of a Crossref work message."""
+    abstract = message.get("abstract")
+    if abstract:
+        try:
+            # Parse and clean XML-like abstract
+            abstract = ET.fromstring(f"<root>{abstract}</root>").text
+            if abstract:
+                abstract = " ".join(abstract.split())
+        except ET.ParseError:
+            # Fallback: remove tags using regex
+            abstract = " ".join(TAG_RE.sub("", abstract).split())
+    
+    pdf_url = None
+    for link in message.get("link", []):
+        if link.get("content-type") == "application/pdf":
+            pdf_url = link.get("URL")
+            break
+    
+    return abstract, pdf_url
+
 
 async def fetch_crossref(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
     """
@@ -41,7 +70,7 @@ async def fetch_crossref(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
             }, {"status_code": resp.status_code, "url": url}
         
         try:
-            data = resp.json()
+            data = response_json(resp)
         except Exception as je:
             log.error("crossref_json_parse_error", doi=rec.doi_norm, error=str(je))
             return {
@@ -72,25 +101,7 @@ async def fetch_crossref(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
             "error": f"unexpected: {e}",
         }, {"url": url, "error": str(e)}
     
-    # Parse abstract and links
-    abstract = data.get("message", {}).get("abstract")
-    if abstract:
-        try:
-            # Parse and clean XML-like abstract
-            abstract = ET.fromstring(f"<root>{abstract}</root>").text
-            if abstract:
-                abstract = re.sub(r"\s+", " ", abstract).strip()
-        except ET.ParseError:
-            # Fallback: remove tags using regex
-            abstract = re.sub(r"<[^>]+>", "", abstract)
-            abstract = re.sub(r"\s+", " ", abstract).strip()
-    
-    links = data.get("message", {}).get("link", [])
-    pdf_url = None
-    for link in links:
-        if link.get("content-type") == "application/pdf":
-            pdf_url = link.get("URL")
-            break
+    abstract, pdf_url = _parse_crossref_message(data.get("message", {}))
     
     log.info(
         "crossref_fetched",
@@ -107,3 +118,48 @@ async def fetch_crossref(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
         "status_code": resp.status_code,
         "message": data.get("message", {}),
     }
+
+
+async def fetch_crossref_batch(
+    dois: list[str],
+) -> dict[str, tuple[dict[str, Any], dict[str, Any]]]:
+    """
+    Fetch Crossref metadata for up to CROSSREF_BATCH_SIZE DOIs in one request.
+    
+    Uses the works?filter=doi:... endpoint. Results are keyed by normalized DOI and
+    shaped like fetch_crossref's return value; DOIs Crossref does not return are
+    absent, and any request failure returns an empty dict so callers fall back to
+    fetch_crossref per record.
+    """
+    # Commas separate filter values, so such DOIs cannot be batched
+    dois = [doi for doi in dois if "," not in doi]
+    if not dois:
+        return {}
+    
+    filter_value = quote(",".join(f"doi:{doi}" for doi in dois), safe=":,/")
+    url = f"https://api.crossref.org/works?filter={filter_value}&rows={len(dois)}"
+    headers = {"User-Agent": "llm_query_doc_analyser/1.0"}
+    
+    try:
+        resp = await get_with_retry(url, headers=headers, timeout=30.0)
+        if resp.status_code != 200:
+            log.warning("crossref_batch_non_200", count=len(dois), status=resp.status_code)
+            return {}
+        items = response_json(resp).get("message", {}).get("items", [])
+    except Exception as e:
+        log.warning("crossref_batch_failed", count=len(dois), error=str(e))
+        return {}
+    
+    results: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+    for item in items:
+        doi = normalize_doi(item.get("DOI"))
+        if not doi:
+            continue
+        abstract, pdf_url = _parse_crossref_message(item)
+        results[doi] = (
+            {"abstract": abstract, "oa_pdf_url": pdf_url},
+            {"url": url, "status_code": resp.status_code, "message": item},
+        )
+    
+    log.info("crossref_batch_fetched", requested=len(dois), found=len(results))
+    return results
@@ -1,13 +1,47 @@
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 
+from ..core.hashing import normalize_doi
 from ..core.models import Record
-from ..utils.http import get_with_retry
+from ..utils.http import get_with_retry, response_json
 from ..utils.log import get_logger
 
 log = get_logger(__name__)
 
+# DOIs per works?filter=doi:... request in fetch_openalex_batch (OpenAlex caps OR filters)
+OPENALEX_BATCH_SIZE = 50
+
+
+def _abstract_from_inverted_index(idx: Any, doi: str | None) -> str | None:
+    """Rebuild an abstract from OpenAlex's abstract_inverted_index (word -> positions)."""
+    if not idx or not isinstance(idx, dict):
+        return None
+    try:
+        # Positions are normally dense, so size the list by the number of positions and
+        # only fall back to sizing by the max position (leaving gaps) if one falls outside it
+        words = [""] * sum(map(len, idx.values()))
+        try:
+            for word, positions in idx.items():
+                for pos in positions:
+                    words[pos] = word
+        except IndexError:
+            words = [""] * (max(max(v) for v in idx.values() if v) + 1)
+            for word, positions in idx.items():
+                for pos in positions:
+                    words[pos] = word
+        if "" in words:
+            words = [w for w in words if w]
+        return " ".join(words) or None
+    except (ValueError, TypeError) as e:
+        log.warning(
+            "openalex_abstract_parse_error",
+            doi=doi,
+            error=str(e),
+        )
+        return None
+
 
 async def fetch_openalex(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
     """
@@ -38,7 +72,7 @@ async def fetch_openalex(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
             }, {"status_code": resp.status_code, "url": url}
         
         try:
-            data = resp.json()
+            data = response_json(resp)
         except Exception as je:
             log.error("openalex_json_parse_error", doi=rec.doi_norm, error=str(je))
             return {
@@ -56,25 +90,7 @@ async def fetch_openalex(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
         log.exception("openalex_unexpected_error", doi=rec.doi_norm, url=url)
         return {"abstract": None, "error": f"unexpected: {e}"}, {"url": url, "error": str(e)}
     
-    # Parse abstract_inverted_index
-    idx = data.get("abstract_inverted_index")
-    abstract = None
-    
-    if idx and isinstance(idx, dict) and idx:
-        try:
-            max_pos = max(max(v) for v in idx.values() if v)
-            words: list[str | None] = [None] * (max_pos + 1)
-            for word, positions in idx.items():
-                for pos in positions:
-                    words[pos] = word
-            abstract = " ".join(w for w in words if w is not None)
-        except (ValueError, TypeError) as e:
-            log.warning(
-                "openalex_abstract_parse_error",
-                doi=rec.doi_norm,
-                error=str(e),
-            )
-            abstract = None
+    abstract = _abstract_from_inverted_index(data.get("abstract_inverted_index"), rec.doi_norm)
     
     log.info(
         "openalex_fetched",
@@ -87,3 +103,48 @@ async def fetch_openalex(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
         "status_code": resp.status_code,
         "data": data,
     }
+
+
+async def fetch_openalex_batch(
+    dois: list[str],
+) -> dict[str, tuple[dict[str, Any], dict[str, Any]]]:
+    """
+    Fetch OpenAlex works for up to OPENALEX_BATCH_SIZE DOIs in one request.
+    
+    Uses the works?filter=doi:a|b endpoint. Results are keyed by normalized DOI and
+    shaped like fetch_openalex's return value; DOIs OpenAlex does not return are
+    absent, and any request failure returns an empty dict so callers fall back to
+    fetch_openalex per record.
+    """
+    # "|" separates filter values, so such DOIs cannot be batched
+    dois = [doi for doi in dois if "|" not in doi]
+    if not dois:
+        return {}
+    
+    filter_value = quote("doi:" + "|".join(dois), safe=":/|")
+    url = f"https://api.openalex.org/works?filter={filter_value}&per-page={len(dois)}"
+    headers = {"User-Agent": "llm_query_doc_analyser/1.0"}
+    
+    try:
+        resp = await get_with_retry(url, headers=headers, timeout=30.0)
+        if resp.status_code != 200:
+            log.warning("openalex_batch_non_200", count=len(dois), status=resp.status_code)
+            return {}
+        works = response_json(resp).get("results", [])
+    except Exception as e:
+        log.warning("openalex_batch_failed", count=len(dois), error=str(e))
+        return {}
+    
+    results: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+    for work in works:
+        doi = normalize_doi(work.get("doi"))
+        if not doi:
+            continue
+        abstract = _abstract_from_inverted_index(work.get("abstract_inverted_index"), doi)
+        results[doi] = (
+            {"abstract": abstract},
+            {"url": url, "status_code": resp.status_code, "data": work},
+        )
+    
+    log.info("openalex_batch_fetched", requested=len(dois), found=len(results))
+    return results
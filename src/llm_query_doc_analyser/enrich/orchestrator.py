@@ -1,14 +1,17 @@
-import re
-from collections.abc import Awaitable, Callable
+import asyncio
+import copy
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypedDict
 
 from ..core.models import Record
 from ..utils.http import RateLimiter
 from ..utils.log import get_logger
-from .crossref import fetch_crossref
+from .arxiv import ARXIV_DOI_PATTERN
+from .crossref import CROSSREF_BATCH_SIZE, fetch_crossref, fetch_crossref_batch
 from .europepmc import fetch_europepmc
-from .openalex import fetch_openalex
+from .openalex import OPENALEX_BATCH_SIZE, fetch_openalex, fetch_openalex_batch
 from .preprint_detection import detect_preprint_source
 from .preprint_providers import fetch_preprint_metadata
 from .pubmed import fetch_pubmed
@@ -18,20 +21,141 @@ from .version_linking import process_preprint_to_published_linking
 
 log = get_logger(__name__)
 
-# Global rate limiters for different APIs (calls per second)
+# Global rate limiters for different APIs (calls per second). Each bucket holds one
+# second's worth of calls, so short bursts go out at once while the average rate holds.
 # ArXiv recommends 1 call per 3 seconds = 0.33 calls/sec
 RATE_LIMITERS = {
-    "arxiv": RateLimiter(calls_per_second=0.33),
-    "crossref": RateLimiter(calls_per_second=1.0),  # Polite rate
-    "openalex": RateLimiter(calls_per_second=5.0),  # No strict limit but be polite
-    "europepmc": RateLimiter(calls_per_second=2.0),  # Be polite
-    "pubmed": RateLimiter(calls_per_second=3.0),  # NCBI guideline without API key
-    "s2": RateLimiter(calls_per_second=5.0),  # With API key can be higher
-    "unpaywall": RateLimiter(calls_per_second=5.0),  # Be polite
-    "preprints": RateLimiter(calls_per_second=2.0),  # General preprint sources
+    "arxiv": RateLimiter(calls_per_second=0.33, burst=1),
+    "crossref": RateLimiter(calls_per_second=1.0, burst=1),  # Polite rate
+    "openalex": RateLimiter(calls_per_second=5.0, burst=5),  # No strict limit but be polite
+    "europepmc": RateLimiter(calls_per_second=2.0, burst=2),  # Be polite
+    "pubmed": RateLimiter(calls_per_second=3.0, burst=3),  # NCBI guideline without API key
+    "s2": RateLimiter(calls_per_second=5.0, burst=5),  # With API key can be higher
+    "unpaywall": RateLimiter(calls_per_second=5.0, burst=5),  # Be polite
+    "preprints": RateLimiter(calls_per_second=2.0, burst=2),  # General preprint sources
 }
 
 
+class FetchCache:
+    """
+    Shares per-record source fetches across one enrich_records call.
+
+    Concurrent fetches of the same (source key, DOI) await a single rate-limited
+    request, and successful results are kept in a bounded LRU for later records
+    with that DOI. The in-flight tasks belong to the event loop of that call, so a
+    cache must not be reused from another asyncio.run().
+
+    Every caller gets its own deep copy of a result, so records never share the
+    raw response dicts stored in their provenance.
+    """
+
+    def __init__(self, maxsize: int = 1_000) -> None:
+        self.maxsize = maxsize
+        self._inflight: dict[tuple[str, str], asyncio.Task[Any]] = {}
+        self._results: OrderedDict[tuple[str, str], Any] = OrderedDict()
+
+    def _remember(self, cache_key: tuple[str, str], task: asyncio.Task[Any]) -> None:
+        """Cache a finished fetch's (data, raw) result unless it failed or reported an error."""
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        data = result[0] if isinstance(result, tuple) else None
+        if not data or data.get("error"):
+            return
+        self._results[cache_key] = result
+        self._results.move_to_end(cache_key)
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    async def fetch(
+        self,
+        key: str,
+        doi: str | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run fetch() once per (key, doi): concurrent callers await the same result, and
+        successful results are served from the LRU afterwards.
+        
+        Parameters:
+        key (str): Source key, e.g. "crossref".
+        doi (str | None): Normalized DOI; fetches without a DOI are never shared.
+        fetch (Callable[[], Awaitable[Any]]): Performs the rate-limited API call.
+        
+        Returns:
+        Any: A private copy of the fetch result (exceptions propagate to every caller).
+        """
+        if not doi:
+            return await fetch()
+        cache_key = (key, doi)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            self._results.move_to_end(cache_key)
+            log.debug("fetch_cache_hit", source=key, doi=doi)
+            return copy.deepcopy(cached)
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[cache_key] = task
+
+            def on_done(done: asyncio.Task[Any]) -> None:
+                self._inflight.pop(cache_key, None)
+                self._remember(cache_key, done)
+
+            task.add_done_callback(on_done)
+        else:
+            log.debug("fetch_coalesced", source=key, doi=doi)
+        # Shielded so one caller being cancelled does not cancel the others' request
+        return copy.deepcopy(await asyncio.shield(task))
+
+
+# Sources whose APIs accept many DOIs per request: key -> (batch fetcher, DOIs per request)
+BATCH_FETCHERS = {
+    "crossref": (fetch_crossref_batch, CROSSREF_BATCH_SIZE),
+    "openalex": (fetch_openalex_batch, OPENALEX_BATCH_SIZE),
+}
+
+# Prefetched fetcher results: source key -> normalized DOI -> (data, raw)
+Prefetched = dict[str, dict[str, tuple[dict[str, Any], dict[str, Any]]]]
+
+
+async def prefetch_batch_sources(records: list[Record]) -> Prefetched:
+    """
+    Fetch batchable sources for all records' DOIs up front, one request per chunk.
+    
+    Each chunk request goes through the source's rate limiter, so N records cost
+    about N / batch size rate-limited calls instead of N. DOIs missing from the
+    result are fetched per record by the enrichment pipeline as before.
+    
+    Parameters:
+    records (list[Record]): Records about to be enriched.
+    
+    Returns:
+    Prefetched: Results per source key, keyed by normalized DOI.
+    """
+    dois = list(dict.fromkeys(rec.doi_norm for rec in records if rec.doi_norm))
+
+    async def prefetch_source(key: str) -> dict[str, tuple[dict[str, Any], dict[str, Any]]]:
+        fetcher, batch_size = BATCH_FETCHERS[key]
+        rate_limiter = RATE_LIMITERS.get(key)
+        results: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+        for start in range(0, len(dois), batch_size):
+            if rate_limiter:
+                await rate_limiter.acquire()
+            results.update(await fetcher(dois[start:start + batch_size]))
+        return results
+
+    keys = list(BATCH_FETCHERS)
+    fetched = await asyncio.gather(*(prefetch_source(key) for key in keys))
+    prefetched = dict(zip(keys, fetched, strict=True))
+    log.info(
+        "batch_sources_prefetched",
+        dois=len(dois),
+        found={key: len(results) for key, results in prefetched.items()},
+    )
+    return prefetched
+
+
 def extract_arxiv_id(rec: Record) -> None:
     """
     Extract and set arXiv ID from DOI if present.
@@ -39,23 +163,32 @@ def extract_arxiv_id(rec: Record) -> None:
     Parameters:
     rec (Record): The record to process.
     """
-    ARXIV_DOI_PATTERN = re.compile(r"arxiv:(\d{4}\.\d{4,5})(v\d+)?", re.IGNORECASE)
     # Set arxiv_id if DOI is arXiv
-    if rec.doi_norm and ARXIV_DOI_PATTERN.match(rec.doi_norm):
-        m = ARXIV_DOI_PATTERN.match(rec.doi_norm)
-        rec.arxiv_id = m.group(1) if m else None
+    m = ARXIV_DOI_PATTERN.match(rec.doi_norm) if rec.doi_norm else None
+    if m:
+        rec.arxiv_id = m.group(1)
+
+
+# Per-record source fetcher: (rec[, client]) -> (data, raw)
+Fetcher = Callable[..., Awaitable[tuple[dict[str, Any] | None, dict[str, Any] | None]]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnrichmentSource:
     """Represents an enrichment source with its metadata."""
     name: str
     key: str
-    fetcher: Callable[..., Awaitable[tuple[dict[str, Any] | None, dict[str, Any] | None]]]
+    fetcher_name: str  # name of the fetch function in this module
     requires_client: bool = False
+
+    @property
+    def fetcher(self) -> Fetcher:
+        """The fetch function, looked up on each use so patching the module name takes effect."""
+        fetcher: Fetcher = globals()[self.fetcher_name]
+        return fetcher
     
     
-@dataclass
+@dataclass(slots=True)
 class EnrichmentResult:
     """Result of an enrichment attempt from a single source."""
     source_name: str
@@ -66,26 +199,82 @@ class EnrichmentResult:
     raw_data: dict[str, Any] | None = None
 
 
+class AbstractAttempt(TypedDict):
+    """One abstract source's outcome, as listed in an enrichment report."""
+
+    source: str
+    status: str  # 'success'|'failed'
+    reason: str | None
+
+
+# Standard abstract sources in order of precedence, shared by every enrich_record call
+ABSTRACT_SOURCES: tuple[EnrichmentSource, ...] = (
+    EnrichmentSource(
+        name="Semantic Scholar",
+        key="s2",
+        fetcher_name="fetch_semanticscholar",
+        requires_client=True,
+    ),
+    EnrichmentSource(
+        name="Crossref",
+        key="crossref",
+        fetcher_name="fetch_crossref",
+        requires_client=False,
+    ),
+    EnrichmentSource(
+        name="OpenAlex",
+        key="openalex",
+        fetcher_name="fetch_openalex",
+        requires_client=False,
+    ),
+    EnrichmentSource(
+        name="EuropePMC",
+        key="epmc",
+        fetcher_name="fetch_europepmc",
+        requires_client=False,
+    ),
+    EnrichmentSource(
+        name="PubMed",
+        key="pubmed",
+        fetcher_name="fetch_pubmed",
+        requires_client=False,
+    ),
+)
+
+
 class AbstractEnrichmentPipeline:
     """
     Chain of Responsibility pattern for abstract retrieval.
     Tries multiple sources in order until an abstract is found.
     """
     
-    def __init__(self, sources: list[EnrichmentSource]):
+    def __init__(
+        self,
+        sources: Sequence[EnrichmentSource],
+        prefetched: Prefetched | None = None,
+        early_exit: bool = False,
+        fetch_cache: FetchCache | None = None,
+    ):
         """
         Initialize the pipeline with ordered sources.
         
         Parameters:
-        sources (list[EnrichmentSource]): Ordered list of sources to try.
+        sources (Sequence[EnrichmentSource]): Ordered sources to try.
+        prefetched (Prefetched | None): Batch-fetched results used instead of calling a source.
+        early_exit (bool): Query sources one at a time and stop at the first abstract,
+            trading the remaining sources' provenance for fewer API calls.
+        fetch_cache (FetchCache | None): Shares fetches with other records of the same run.
         """
         self.sources = sources
+        self.prefetched = prefetched or {}
+        self.early_exit = early_exit
+        self.fetch_cache = fetch_cache or FetchCache()
     
     async def enrich(
         self,
         rec: Record,
         clients: dict[str, Any]
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    ) -> tuple[list[AbstractAttempt], dict[str, Any]]:
         """
         Attempt to enrich record with abstract from available sources.
         
@@ -96,19 +285,42 @@ class AbstractEnrichmentPipeline:
         Returns:
         tuple: (list of attempt reports, provenance dict)
         """
-        attempts = []
+        attempts: list[AbstractAttempt] = []
         provenance = {}
         
-        for source in self.sources:
-            # Check if source is available (e.g., S2 is optional)
-            if source.key == "s2" and not clients.get("s2"):
-                continue
-            
-            result = await self._try_source(rec, source, clients)
+        # Check if source is available (e.g., S2 is optional)
+        sources = [s for s in self.sources if not (s.key == "s2" and not clients.get("s2"))]
+        
+        results: list[EnrichmentResult]
+        if self.early_exit:
+            results = []
+            found = bool(rec.abstract_text)
+            for source in sources:
+                if found:
+                    break
+                result = await self._try_source(rec, source, clients)
+                results.append(result)
+                found = result.has_abstract
+            sources = sources[:len(results)]
+        else:
+            # Every source is queried to populate provenance, so fetch them concurrently;
+            # each still waits on its own rate limiter inside _try_source. A failure
+            # cancels the sibling fetches instead of leaving them running unobserved
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._try_source(rec, source, clients)) for source in sources
+                ]
+            results = [task.result() for task in tasks]
+        
+        # Apply results in source order so precedence is unchanged
+        for source, result in zip(sources, results, strict=True):
             provenance[source.key] = result.raw_data
             
+            if result.has_abstract and rec.abstract_text:
+                result.reason = f"Abstract already retrieved successfully by {rec.abstract_source}"
+            
             # Record attempt
-            attempt_report = {
+            attempt_report: AbstractAttempt = {
                 "source": result.source_name,
                 "status": "success" if result.success else "failed",
                 "reason": result.reason,
@@ -124,12 +336,25 @@ class AbstractEnrichmentPipeline:
                     doi=rec.doi_norm,
                     source=source.key,
                 )
-            
-            # Continue checking other sources even after finding abstract
-            # to populate provenance data
         
         return attempts, provenance
     
+    async def _fetch(
+        self,
+        rec: Record,
+        source: EnrichmentSource,
+        clients: dict[str, Any]
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Call a source's fetcher for a record after applying its rate limit."""
+        rate_limiter = RATE_LIMITERS.get(source.key)
+        if rate_limiter:
+            await rate_limiter.acquire()
+        
+        # Handle sources that require client parameter
+        if source.requires_client:
+            return await source.fetcher(rec, clients.get(source.key))
+        return await source.fetcher(rec)
+    
     async def _try_source(
         self,
         rec: Record,
@@ -148,16 +373,14 @@ class AbstractEnrichmentPipeline:
         EnrichmentResult: Result of the enrichment attempt.
         """
         try:
-            # Apply rate limiting before API call
-            rate_limiter = RATE_LIMITERS.get(source.key)
-            if rate_limiter:
-                await rate_limiter.acquire()
-            
-            # Handle sources that require client parameter
-            if source.requires_client:
-                data, raw = await source.fetcher(rec, clients.get(source.key))
+            prefetched = self.prefetched.get(source.key, {}).get(rec.doi_norm or "")
+            if prefetched is not None:
+                # Copied like FetchCache results: records sharing a DOI must not share raw dicts
+                data, raw = copy.deepcopy(prefetched)
             else:
-                data, raw = await source.fetcher(rec)
+                data, raw = await self.fetch_cache.fetch(
+                    source.key, rec.doi_norm, lambda: self._fetch(rec, source, clients)
+                )
             
             if data is None:
                 return EnrichmentResult(
@@ -169,16 +392,11 @@ class AbstractEnrichmentPipeline:
                 )
             
             if data.get("abstract"):
-                reason = (
-                    "Abstract retrieved successfully"
-                    if not rec.abstract_text
-                    else f"Abstract already retrieved successfully by {rec.abstract_source}"
-                )
                 return EnrichmentResult(
                     source_name=source.name,
                     success=True,
                     has_abstract=True,
-                    reason=reason,
+                    reason="Abstract retrieved successfully",
                     data=data,
                     raw_data=raw,
                 )
@@ -311,6 +529,13 @@ class PreprintEnricher:
 class OpenAccessEnricher:
     """Strategy pattern for Open Access enrichment via Unpaywall."""
     
+    def __init__(self, fetch_cache: FetchCache | None = None):
+        """
+        Parameters:
+        fetch_cache (FetchCache | None): Shares fetches with other records of the same run.
+        """
+        self.fetch_cache = fetch_cache or FetchCache()
+    
     async def enrich(
         self,
         rec: Record
@@ -324,12 +549,14 @@ class OpenAccessEnricher:
         Returns:
         tuple: (OA report dict, raw provenance data)
         """
-        # Apply rate limiting before fetching unpaywall data
-        rate_limiter = RATE_LIMITERS.get("unpaywall")
-        if rate_limiter:
-            await rate_limiter.acquire()
+        async def fetch() -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+            # Apply rate limiting before fetching unpaywall data
+            rate_limiter = RATE_LIMITERS.get("unpaywall")
+            if rate_limiter:
+                await rate_limiter.acquire()
+            return await fetch_unpaywall(rec)
         
-        upw, upw_raw = await fetch_unpaywall(rec)
+        upw, upw_raw = await self.fetch_cache.fetch("unpaywall", rec.doi_norm, fetch)
         
         if upw:
             rec.is_oa = upw.get("is_oa")
@@ -408,7 +635,13 @@ async def _detect_and_mark_preprint(rec: Record) -> dict[str, Any]:
         }
 
 
-async def enrich_record(rec: Record, clients: dict[str, Any]) -> Record:
+async def enrich_record(
+    rec: Record,
+    clients: dict[str, Any],
+    prefetched: Prefetched | None = None,
+    early_exit: bool = False,
+    fetch_cache: FetchCache | None = None,
+) -> Record:
     """
     Enrich a record with abstract and OA info, keeping provenance for each service.
     
@@ -420,24 +653,18 @@ async def enrich_record(rec: Record, clients: dict[str, Any]) -> Record:
     Parameters:
     rec (Record): The record to enrich.
     clients (dict[str, Any]): Dictionary of API clients (e.g., {'s2': client}).
+    prefetched (Prefetched | None): Results from prefetch_batch_sources, if any.
+    early_exit (bool): Stop querying abstract sources once one returns an abstract.
+    fetch_cache (FetchCache | None): Fetch sharing for the current run, if any.
     
     Returns:
     Record: The enriched record with detailed enrichment_report.
     """
     log.debug("enrichment_started", doi=rec.doi_norm, title=rec.title[:200])
 
-    # Initialize enrichment report
-    enrichment_report: dict[str, Any] = {
-        "record_title": rec.title[:80] + "..." if len(rec.title) > 80 else rec.title,
-        "doi": rec.doi_norm,
-        "preprint_detection": {},
-        "abstract_attempts": [],
-        "oa_check": {},
-        "final_status": {},
-    }
-
     # Step 1: Detect and mark preprint
-    enrichment_report["preprint_detection"] = await _detect_and_mark_preprint(rec)
+    preprint_detection = await _detect_and_mark_preprint(rec)
+    abstract_attempts: list[AbstractAttempt] = []
 
     # Step 2: Handle preprint-specific enrichment
     preprint_provenance: dict[str, Any] = {}
@@ -447,14 +674,14 @@ async def enrich_record(rec: Record, clients: dict[str, Any]) -> Record:
         
         # Update enrichment report with preprint-specific info
         if preprint_report.get("abstract_set"):
-            enrichment_report["abstract_attempts"].append({
+            abstract_attempts.append({
                 "source": rec.preprint_source,
                 "status": "success",
                 "reason": "Abstract retrieved successfully from preprint source",
             })
         
         if preprint_report.get("published_version"):
-            enrichment_report["preprint_detection"]["published_version"] = (
+            preprint_detection["published_version"] = (
                 preprint_report["published_version"]
             )
         
@@ -470,61 +697,31 @@ async def enrich_record(rec: Record, clients: dict[str, Any]) -> Record:
             )
 
     # Step 3: Try standard abstract sources
-    # Define enrichment sources in order of precedence
-    abstract_sources = [
-        EnrichmentSource(
-            name="Semantic Scholar",
-            key="s2",
-            fetcher=fetch_semanticscholar,
-            requires_client=True,
-        ),
-        EnrichmentSource(
-            name="Crossref",
-            key="crossref",
-            fetcher=fetch_crossref,
-            requires_client=False,
-        ),
-        EnrichmentSource(
-            name="OpenAlex",
-            key="openalex",
-            fetcher=fetch_openalex,
-            requires_client=False,
-        ),
-        EnrichmentSource(
-            name="EuropePMC",
-            key="epmc",
-            fetcher=fetch_europepmc,
-            requires_client=False,
-        ),
-        EnrichmentSource(
-            name="PubMed",
-            key="pubmed",
-            fetcher=fetch_pubmed,
-            requires_client=False,
-        ),
-    ]
-    
-    abstract_pipeline = AbstractEnrichmentPipeline(abstract_sources)
-    abstract_attempts, abstract_provenance = await abstract_pipeline.enrich(rec, clients)
-    
-    enrichment_report["abstract_attempts"].extend(abstract_attempts)
+    abstract_pipeline = AbstractEnrichmentPipeline(
+        ABSTRACT_SOURCES, prefetched, early_exit, fetch_cache
+    )
 
-    # Step 4: Open Access enrichment
-    oa_enricher = OpenAccessEnricher()
-    oa_report, oa_provenance = await oa_enricher.enrich(rec)
-    enrichment_report["oa_check"] = oa_report
+    # Step 4: Open Access enrichment, run alongside the abstract pipeline: the OA
+    # enricher only writes is_oa/oa_status/license/oa_pdf_url, which the pipeline never reads
+    oa_enricher = OpenAccessEnricher(fetch_cache)
+    async with asyncio.TaskGroup() as tg:
+        abstract_task = tg.create_task(abstract_pipeline.enrich(rec, clients))
+        oa_task = tg.create_task(oa_enricher.enrich(rec))
+    pipeline_attempts, abstract_provenance = abstract_task.result()
+    oa_report, oa_provenance = oa_task.result()
+    abstract_attempts.extend(pipeline_attempts)
 
     # Step 5: Combine all provenance data
-    all_provenance = {**preprint_provenance, **abstract_provenance}
+    rec.provenance.update(preprint_provenance)
+    rec.provenance.update(abstract_provenance)
     if oa_provenance:
-        all_provenance["unpaywall"] = oa_provenance
-    rec.provenance.update(all_provenance)
+        rec.provenance["unpaywall"] = oa_provenance
 
     # Step 6: Generate final status summary and track abstract retrieval failure reasons
     if not rec.abstract_text:
         # Compile reasons why abstract wasn't retrieved
         failure_reasons = []
-        for attempt in enrichment_report["abstract_attempts"]:
+        for attempt in abstract_attempts:
             if attempt["status"] == "failed":
                 failure_reasons.append(f"{attempt['source']}: {attempt['reason']}")
         
@@ -541,18 +738,24 @@ async def enrich_record(rec: Record, clients: dict[str, Any]) -> Record:
     else:
         rec.abstract_no_retrieval_reason = None  # Clear if abstract was found
     
-    enrichment_report["final_status"] = {
-        "abstract_found": bool(rec.abstract_text),
-        "abstract_source": rec.abstract_source if rec.abstract_text else None,
-        "abstract_no_retrieval_reason": rec.abstract_no_retrieval_reason,
-        "is_oa": rec.is_oa,
-        "oa_status": rec.oa_status,
-        "is_preprint": rec.is_preprint,
-        "preprint_source": rec.preprint_source,
-        "has_published_version": bool(rec.published_doi),
+    # Store the report in the record for later retrieval, built once all parts are known
+    enrichment_report: dict[str, Any] = {
+        "record_title": rec.title[:80] + "..." if len(rec.title) > 80 else rec.title,
+        "doi": rec.doi_norm,
+        "preprint_detection": preprint_detection,
+        "abstract_attempts": abstract_attempts,
+        "oa_check": oa_report,
+        "final_status": {
+            "abstract_found": bool(rec.abstract_text),
+            "abstract_source": rec.abstract_source if rec.abstract_text else None,
+            "abstract_no_retrieval_reason": rec.abstract_no_retrieval_reason,
+            "is_oa": rec.is_oa,
+            "oa_status": rec.oa_status,
+            "is_preprint": rec.is_preprint,
+            "preprint_source": rec.preprint_source,
+            "has_published_version": bool(rec.published_doi),
+        },
     }
-
-    # Store the report in the record for later retrieval
     rec.enrichment_report = enrichment_report
 
     log.debug(
@@ -571,6 +774,44 @@ async def enrich_record(rec: Record, clients: dict[str, Any]) -> Record:
     return rec
 
 
+async def enrich_records(
+    recs: list[Record],
+    clients: dict[str, Any],
+    max_concurrency: int = 32,
+    early_exit: bool = False,
+) -> list[Record]:
+    """
+    Enrich many records concurrently, prefetching batchable sources first.
+    
+    At most max_concurrency records are in flight at once; the per-API RATE_LIMITERS
+    still pace requests across all of them.
+    
+    Parameters:
+    recs (list[Record]): Records to enrich.
+    clients (dict[str, Any]): Dictionary of API clients (e.g., {'s2': client}).
+    max_concurrency (int): Maximum number of records enriched at the same time.
+    early_exit (bool): Stop querying abstract sources once one returns an abstract.
+    
+    Returns:
+    list[Record]: The enriched records, in input order.
+    """
+    prefetched = await prefetch_batch_sources(recs)
+    # Owned by this call, so nothing bound to its event loop outlives it
+    fetch_cache = FetchCache()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def enrich_one(rec: Record) -> Record:
+        async with semaphore:
+            return await enrich_record(rec, clients, prefetched, early_exit, fetch_cache)
+
+    return await asyncio.gather(*(enrich_one(rec) for rec in recs))
+
+
+# Report separators, built once rather than per formatted record
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+
+
 def format_enrichment_report(rec: Record) -> str:
     """
     Format the enrichment report for a record into a readable string.
@@ -585,16 +826,19 @@ def format_enrichment_report(rec: Record) -> str:
         return f"No enrichment report available for: {rec.title[:60]}"
 
     report = rec.enrichment_report
-    lines = []
+    preprint_info = report["preprint_detection"]
+    oa_info = report["oa_check"]
+    final = report["final_status"]
 
     # Header
-    lines.append("=" * 80)
-    lines.append(f"Record: {report['record_title']}")
-    lines.append(f"DOI: {report['doi']}")
-    lines.append("-" * 80)
+    lines = [
+        _SEP_EQ,
+        f"Record: {report['record_title']}",
+        f"DOI: {report['doi']}",
+        _SEP_DASH,
+    ]
 
     # Preprint detection
-    preprint_info = report["preprint_detection"]
     if preprint_info["is_preprint"]:
         lines.append(f"✓ Preprint detected: {preprint_info['source']}")
         if "published_version" in preprint_info:
@@ -606,31 +850,28 @@ def format_enrichment_report(rec: Record) -> str:
         lines.append("○ Not a preprint")
 
     # Abstract attempts
-    lines.append("")
-    lines.append("Abstract retrieval attempts:")
+    lines += ["", "Abstract retrieval attempts:"]
     if not report["abstract_attempts"]:
         lines.append("  (No attempts made - preprint abstract used)")
     else:
-        for attempt in report["abstract_attempts"]:
-            status_icon = "✓" if attempt["status"] == "success" else "✗"
-            lines.append(f"  {status_icon} {attempt['source']}: {attempt['reason']}")
+        lines += [
+            f"  {'✓' if attempt['status'] == 'success' else '✗'} "
+            f"{attempt['source']}: {attempt['reason']}"
+            for attempt in report["abstract_attempts"]
+        ]
 
     # OA check
     lines.append("")
-    oa_info = report["oa_check"]
-    if oa_info["status"] == "success":
-        if oa_info["is_oa"]:
-            pdf_status = "with PDF" if oa_info["has_pdf"] else "no PDF"
-            lines.append(f"✓ Open Access: {oa_info['oa_status']} ({pdf_status})")
-        else:
-            lines.append("○ Not Open Access")
-    else:
+    if oa_info["status"] != "success":
         lines.append(f"✗ OA check failed: {oa_info['reason']}")
+    elif oa_info["is_oa"]:
+        pdf_status = "with PDF" if oa_info["has_pdf"] else "no PDF"
+        lines.append(f"✓ Open Access: {oa_info['oa_status']} ({pdf_status})")
+    else:
+        lines.append("○ Not Open Access")
 
     # Final summary
-    lines.append("")
-    lines.append("Final Status:")
-    final = report["final_status"]
+    lines += ["", "Final Status:"]
     if final["abstract_found"]:
         lines.append(f"  • Abstract: ✓ (from {final['abstract_source']})")
     else:
@@ -643,12 +884,10 @@ def format_enrichment_report(rec: Record) -> str:
         if final["has_published_version"]:
             lines.append("  • Published version: ✓")
 
-    if final["is_oa"]:
-        lines.append(f"  • Open Access: ✓ ({final['oa_status']})")
-    else:
-        lines.append("  • Open Access: ✗")
-
-    lines.append("=" * 80)
-    lines.append("")
+    lines += [
+        f"  • Open Access: ✓ ({final['oa_status']})" if final["is_oa"] else "  • Open Access: ✗",
+        _SEP_EQ,
+        "",
+    ]
 
     return "\n".join(lines)
@@ -4,11 +4,14 @@ from typing import Any
 import httpx
 
 from ..core.models import Record
-from ..utils.http import get_with_retry
+from ..utils.http import get_with_retry, response_json
 from ..utils.log import get_logger
 
 log = get_logger(__name__)
 
+ABSTRACT_TEXT_RE = re.compile(r"<AbstractText.*?>(.*?)</AbstractText>", re.DOTALL)
+TAG_RE = re.compile(r"<[^>]+>")
+
 
 async def fetch_pubmed(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
     """
@@ -40,7 +43,7 @@ async def fetch_pubmed(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
             }, {"status_code": resp.status_code, "url": url}
         
         try:
-            data = resp.json()
+            data = response_json(resp)
         except Exception as je:
             log.error("pubmed_json_parse_error", doi=rec.doi_norm, error=str(je))
             return {
@@ -79,13 +82,13 @@ async def fetch_pubmed(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
         xml = resp2.text
         
         # Parse XML for abstract (simple regex-based extraction)
-        m = re.search(r"<AbstractText.*?>(.*?)</AbstractText>", xml, re.DOTALL)
+        m = ABSTRACT_TEXT_RE.search(xml)
         abstract = m.group(1) if m else None
         
         # Clean up abstract
         if abstract:
-            abstract = re.sub(r"<[^>]+>", "", abstract)  # Remove any remaining tags
-            abstract = re.sub(r"\s+", " ", abstract).strip()
+            abstract = TAG_RE.sub("", abstract)  # Remove any remaining tags
+            abstract = " ".join(abstract.split())
         
         log.info(
             "pubmed_fetched",
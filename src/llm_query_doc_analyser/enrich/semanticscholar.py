@@ -3,7 +3,7 @@ from typing import Any
 import httpx
 
 from ..core.models import Record
-from ..utils.http import get_with_retry
+from ..utils.http import get_with_retry, response_json
 from ..utils.log import get_logger
 
 log = get_logger(__name__)
@@ -46,7 +46,7 @@ async def fetch_semanticscholar(rec: Record, api_key: str) -> tuple[dict[str, An
             }, {"status_code": resp.status_code, "url": url}
         
         try:
-            data = resp.json()
+            data = response_json(resp)
         except Exception as je:
             log.error("semanticscholar_json_parse_error", doi=rec.doi_norm, error=str(je))
             return {
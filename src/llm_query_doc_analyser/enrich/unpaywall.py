@@ -20,7 +20,7 @@ async def fetch_unpaywall(rec: Record) -> tuple[dict, Any]:
     headers = {"User-Agent": f"llm_query_doc_analyser/1.0 (mailto:{email})"}
     
     try:
-        from ..utils.http import get_with_retry
+        from ..utils.http import get_with_retry, response_json
         
         resp = await get_with_retry(url, headers=headers, timeout=15.0)
 
@@ -34,7 +34,7 @@ async def fetch_unpaywall(rec: Record) -> tuple[dict, Any]:
             data = {}
         else:
             try:
-                data = resp.json()
+                data = response_json(resp)
             except Exception as je:
                 log.error(
                     "unpaywall_json_error",
@@ -15,7 +15,7 @@ from ..core.models import Record
 from ..core.store import (
     create_article_version_relation,
     get_published_version_id,
-    get_records,
+    get_record_by_doi,
     insert_record,
 )
 from ..utils.log import get_logger
@@ -36,18 +36,15 @@ def find_record_by_doi(doi_norm: str) -> Record | None:
     if not doi_norm:
         return None
 
-    records = get_records()
-    for rec in records:
-        if rec.doi_norm and rec.doi_norm == doi_norm:
-            return rec
-    return None
+    return get_record_by_doi(doi_norm)
 
 
 def create_published_version_record(
     preprint_rec: Record,
     published_doi: str,
     discovery_source: str | None = None,
-    discovery_metadata: dict[str, Any] | None = None
+    discovery_metadata: dict[str, Any] | None = None,
+    import_datetime: str | None = None,
 ) -> tuple[str, Record] | None:
     """
     Create a new research article record for a published version.
@@ -61,6 +58,7 @@ def create_published_version_record(
         published_doi: DOI of the published version
         discovery_source: API source that provided the version link
         discovery_metadata: Optional metadata about the discovery
+        import_datetime: ISO 8601 timestamp for the new record; defaults to now
 
     Returns:
         New published version Record, or None if creation failed
@@ -93,7 +91,7 @@ def create_published_version_record(
         source_title=None,  # Will be filled during enrichment
         is_preprint=False,
         preprint_source=None,
-        import_datetime=datetime.now(UTC).isoformat(),
+        import_datetime=import_datetime or datetime.now(UTC).isoformat(),
     )
 
     try:
@@ -126,7 +124,8 @@ def link_preprint_to_published(
     preprint_rec: Record,
     published_rec: Record,
     discovery_source: str,
-    discovery_metadata: dict[str, Any] | None = None
+    discovery_metadata: dict[str, Any] | None = None,
+    discovered_at: str | None = None,
 ) -> bool:
     """
     Create relation between pre-print and published records in article_versions table.
@@ -138,6 +137,7 @@ def link_preprint_to_published(
         published_rec: Published version record
         discovery_source: API source that provided the version link
         discovery_metadata: Optional metadata about the discovery
+        discovered_at: ISO 8601 timestamp for the relation; defaults to now
 
     Returns:
         True if linking succeeded, False otherwise
@@ -155,7 +155,8 @@ def link_preprint_to_published(
             preprint_id=preprint_rec.id,
             published_id=published_rec.id,
             discovery_source=discovery_source,
-            discovery_metadata=discovery_metadata
+            discovery_metadata=discovery_metadata,
+            discovered_at=discovered_at,
         )
         
         if relation_id:
@@ -236,6 +237,9 @@ def process_preprint_to_published_linking(
             )
             return existing_published_id, True, "Link already exists"
 
+    # One timestamp for the record and relation created by this link
+    now = datetime.now(UTC).isoformat()
+
     # Find or create published version record
     published_rec: Record | None = find_record_by_doi(published_doi_norm)
     
@@ -245,7 +249,8 @@ def process_preprint_to_published_linking(
             preprint_rec,
             published_doi,
             discovery_source,
-            discovery_metadata
+            discovery_metadata,
+            import_datetime=now,
         ) or (None, None)
         
         if not published_rec:
@@ -256,7 +261,8 @@ def process_preprint_to_published_linking(
         preprint_rec,
         published_rec,
         discovery_source,
-        discovery_metadata
+        discovery_metadata,
+        discovered_at=now,
     )
     
     if success and is_new == "New":
@@ -22,7 +22,7 @@ def sanitize_text_for_filename(text: str) -> str:
     # Remove any remaining invalid characters
     text = INVALID_CHARS_RE.sub("", text)
     # Collapse multiple spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
     return text
 
 
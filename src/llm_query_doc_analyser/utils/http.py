@@ -1,9 +1,12 @@
 import asyncio
 import logging
+import time
+from typing import Any
 
 import httpx
 import structlog
 from tenacity import (
+    RetryCallState,
     after_log,
     before_sleep_log,
     retry,
@@ -12,11 +15,27 @@ from tenacity import (
     wait_exponential,
 )
 
+try:  # optional C-accelerated JSON codec (pip install llm_query_doc_analyser[fast])
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
 log = structlog.get_logger()
 # Get standard logger for tenacity callbacks
 std_log = logging.getLogger(__name__)
 
 
+def response_json(resp: httpx.Response) -> Any:
+    """
+    Decode a JSON response body, with orjson straight from the raw bytes when installed.
+    
+    Decode errors subclass json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 def should_retry_on_status(exception: BaseException) -> bool:
     """Determine if we should retry based on exception type or status code."""
     if isinstance(exception, httpx.HTTPStatusError):
@@ -25,9 +44,22 @@ def should_retry_on_status(exception: BaseException) -> bool:
     return isinstance(exception, (httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout))
 
 
+_exponential_wait = wait_exponential(multiplier=1, min=2, max=60)
+
+
+def wait_retry_after(retry_state: RetryCallState) -> float:
+    """Wait as long as the server's Retry-After header asks (capped at 60s), else back off."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After", "").strip()
+        if retry_after.isdigit():
+            return min(float(retry_after), 60.0)
+    return _exponential_wait(retry_state)
+
+
 @retry(
     stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=2, max=60),
+    wait=wait_retry_after,
     retry=retry_if_exception_type(
         (httpx.HTTPStatusError, httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout)
     ),
@@ -48,7 +80,7 @@ async def get_with_retry(
         url: The URL to request
         headers: Optional headers dict
         timeout: Request timeout in seconds (default: 30)
-        client: Optional existing client to use (useful for connection pooling)
+        client: Optional client to use instead of the shared pooled client
     
     Returns:
         httpx.Response object
@@ -57,13 +89,11 @@ async def get_with_retry(
         httpx.HTTPStatusError: For non-retryable HTTP errors
         httpx.TimeoutException: After all retries exhausted
     """
-    should_close = False
     if client is None:
-        client = httpx.AsyncClient(http2=True, timeout=timeout, follow_redirects=True)
-        should_close = True
+        client = get_shared_client()
     
     try:
-        resp = await client.get(url, headers=headers)
+        resp = await client.get(url, headers=headers, timeout=timeout)
         
         log.info(
             "http_request_success",
@@ -91,9 +121,6 @@ async def get_with_retry(
     except (httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout) as e:
         log.error("http_network_error", url=url, error=str(e), error_type=type(e).__name__)
         raise
-    finally:
-        if should_close and client:
-            await client.aclose()
 
 
 def get_client(email: str | None = None, timeout: float = 30.0) -> httpx.AsyncClient:
@@ -131,18 +158,72 @@ def get_client(email: str | None = None, timeout: float = 30.0) -> httpx.AsyncCl
     )
 
 
+# Process-wide client reused by every get_with_retry call, so TCP/TLS sessions are kept
+# alive across requests; bound to the event loop it was created in
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Return the pooled client for the running event loop, creating it on first use.
+
+    A client cannot be reused across event loops (e.g. successive asyncio.run() calls),
+    so a new one is created when the loop changes. Call aclose_shared_client() before
+    the loop ends to release its connections.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client_loop is not loop or _shared_client.is_closed:
+        # The transport retries failed connection attempts itself, on the pooled
+        # connections, before get_with_retry's backoff ever sees a ConnectError
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
+        _shared_client = httpx.AsyncClient(
+            transport=transport,
+            headers={"User-Agent": "llm_query_doc_analyser/1.0"},
+            follow_redirects=True,
+        )
+        _shared_client_loop = loop
+        log.debug("shared_http_client_created", loop_id=id(loop))
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client if it belongs to the running event loop."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None and _shared_client_loop is asyncio.get_running_loop():
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
+
+
 class RateLimiter:
     """Simple rate limiter using token bucket algorithm."""
     
-    def __init__(self, calls_per_second: float = 1.0) -> None:
+    def __init__(self, calls_per_second: float = 1.0, burst: int = 1) -> None:
         """
         Initialize rate limiter.
         
         Args:
-            calls_per_second: Maximum number of calls allowed per second
+            calls_per_second: Average number of calls allowed per second
+            burst: Bucket capacity, i.e. how many calls may go out back-to-back
+                after an idle period (1 spaces every call evenly)
         """
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
+        self.rate = calls_per_second
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
         self._lock: asyncio.Lock | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
     
@@ -175,15 +256,26 @@ class RateLimiter:
         return self._lock
     
     async def acquire(self) -> None:
-        """Wait until rate limit allows next call."""
-        lock = self._ensure_lock()
-        async with lock:
-            now = asyncio.get_event_loop().time()
-            time_since_last = now - self.last_call
-            
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                log.debug("rate_limit_wait", wait_time=wait_time)
+        """
+        Wait until rate limit allows next call.
+
+        Each caller reserves a token under the lock (the balance may go
+        negative) and then sleeps off its own deficit outside it, so
+        concurrent callers are queued at the configured rate without
+        serializing on the lock.
+        """
+        async with self._ensure_lock():
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait_time > 0:
+            log.debug("rate_limit_wait", wait_time=wait_time)
+            try:
                 await asyncio.sleep(wait_time)
-            
-            self.last_call = asyncio.get_event_loop().time()
+            except asyncio.CancelledError:
+                # Give the reserved slot back so later callers are not pushed out
+                self.tokens = min(self.capacity, self.tokens + 1.0)
+                raise
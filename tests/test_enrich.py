@@ -1,9 +1,19 @@
+import asyncio
 from typing import Any
 
 import pytest
 
 from llm_query_doc_analyser.core.models import Record
-from llm_query_doc_analyser.enrich.orchestrator import enrich_record, format_enrichment_report
+from llm_query_doc_analyser.enrich.openalex import _abstract_from_inverted_index
+from llm_query_doc_analyser.enrich.orchestrator import (
+    ABSTRACT_SOURCES,
+    FetchCache,
+    enrich_record,
+    enrich_records,
+    extract_arxiv_id,
+    format_enrichment_report,
+    prefetch_batch_sources,
+)
 
 
 async def test_enrich_record(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -36,6 +46,183 @@ async def test_enrich_record(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "final_status" in result.enrichment_report
 
 
+async def test_prefetch_batch_sources_chunks_unique_dois(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    async def batch(dois: list[str]) -> dict[str, Any]:
+        calls.append(dois)
+        return {doi: ({"abstract": f"abstract {doi}"}, {}) for doi in dois if doi != "10.1/c"}
+
+    monkeypatch.setattr(
+        "llm_query_doc_analyser.enrich.orchestrator.BATCH_FETCHERS", {"crossref": (batch, 2)}
+    )
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.RATE_LIMITERS", {})
+    recs = [Record(title=doi, doi_norm=doi) for doi in ("10.1/a", "10.1/b", "10.1/a", "10.1/c")]
+    recs.append(Record(title="No DOI"))
+
+    prefetched = await prefetch_batch_sources(recs)
+
+    assert calls == [["10.1/a", "10.1/b"], ["10.1/c"]]
+    assert set(prefetched["crossref"]) == {"10.1/a", "10.1/b"}
+
+
+async def test_enrich_record_uses_prefetched_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def empty(*args: Any, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        return ({"abstract": None}, {})
+
+    async def unexpected(*args: Any, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        raise AssertionError("prefetched source must not be fetched again")
+
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.detect_preprint_source", lambda rec: None)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.fetch_crossref", unexpected)
+    for name in ("fetch_unpaywall", "fetch_openalex", "fetch_europepmc", "fetch_pubmed"):
+        monkeypatch.setattr(f"llm_query_doc_analyser.enrich.orchestrator.{name}", empty)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.RATE_LIMITERS", {})
+
+    rec = Record(title="Test", doi_raw="10.1/abc", doi_norm="10.1/abc")
+    prefetched = {"crossref": {"10.1/abc": ({"abstract": "batched"}, {"message": {}})}}
+    result = await enrich_record(rec, clients={}, prefetched=prefetched)
+
+    assert (result.abstract_text, result.abstract_source) == ("batched", "crossref")
+    assert result.provenance["crossref"] == {"message": {}}
+
+    # A second record with the same DOI gets its own copy of the prefetched response
+    dup = await enrich_record(
+        Record(title="Dup", doi_norm="10.1/abc"), clients={}, prefetched=prefetched
+    )
+    result.provenance["crossref"]["message"]["edited"] = True
+    assert dup.provenance["crossref"] == {"message": {}}
+    assert prefetched["crossref"]["10.1/abc"][1] == {"message": {}}
+
+
+async def test_concurrent_enrichments_share_fetches_for_a_doi(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    async def counting(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
+        calls.append(rec.doi_norm or "")
+        await asyncio.sleep(0)
+        return ({"abstract": "shared"}, {"raw": {"n": 1}})
+
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.detect_preprint_source", lambda rec: None)
+    for name in ("fetch_crossref", "fetch_unpaywall", "fetch_openalex", "fetch_europepmc", "fetch_pubmed"):
+        monkeypatch.setattr(f"llm_query_doc_analyser.enrich.orchestrator.{name}", counting)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.RATE_LIMITERS", {})
+
+    fetch_cache = FetchCache()
+    recs = [Record(title="Dup", doi_norm="10.1/dup") for _ in range(3)]
+    results = await asyncio.gather(
+        *(enrich_record(rec, clients={}, fetch_cache=fetch_cache) for rec in recs)
+    )
+
+    assert len(calls) == 5  # one per source, not per record
+    assert all(rec.abstract_text == "shared" for rec in results)
+    # Each record holds its own copy of the shared raw response
+    results[0].provenance["crossref"]["raw"]["n"] = 2
+    assert results[1].provenance["crossref"]["raw"]["n"] == 1
+
+    # Later enrichments of the same DOI in the run are served from the result cache
+    again = Record(title="Again", doi_norm="10.1/dup")
+    await enrich_record(again, clients={}, fetch_cache=fetch_cache)
+    assert len(calls) == 5
+    # ...but a new run starts with an empty cache
+    await enrich_record(Record(title="Fresh", doi_norm="10.1/dup"), clients={})
+    assert len(calls) == 10
+
+
+async def test_concurrent_sources_keep_precedence(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def slow_crossref(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
+        await asyncio.sleep(0.01)
+        return ({"abstract": "from crossref"}, {})
+
+    async def fast(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
+        return ({"abstract": "from elsewhere"}, {})
+
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.detect_preprint_source", lambda rec: None)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.fetch_crossref", slow_crossref)
+    for name in ("fetch_unpaywall", "fetch_openalex", "fetch_europepmc", "fetch_pubmed"):
+        monkeypatch.setattr(f"llm_query_doc_analyser.enrich.orchestrator.{name}", fast)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.RATE_LIMITERS", {})
+
+    result = await enrich_record(Record(title="T", doi_norm="10.1/order"), clients={})
+
+    assert (result.abstract_text, result.abstract_source) == ("from crossref", "crossref")
+    reasons = [a["reason"] for a in result.enrichment_report["abstract_attempts"]]
+    assert reasons[0] == "Abstract retrieved successfully"
+    assert reasons[1] == "Abstract already retrieved successfully by crossref"
+
+
+async def test_early_exit_stops_at_first_abstract(monkeypatch: pytest.MonkeyPatch) -> None:
+    called: list[str] = []
+
+    def fetcher(name: str, abstract: str | None) -> Any:
+        async def fetch(rec: Record) -> tuple[dict[str, Any], dict[str, Any]]:
+            called.append(name)
+            return ({"abstract": abstract}, {})
+
+        return fetch
+
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.detect_preprint_source", lambda rec: None)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.fetch_crossref", fetcher("crossref", None))
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.fetch_openalex", fetcher("openalex", "found"))
+    for name in ("fetch_europepmc", "fetch_pubmed", "fetch_unpaywall"):
+        monkeypatch.setattr(f"llm_query_doc_analyser.enrich.orchestrator.{name}", fetcher(name, "late"))
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.RATE_LIMITERS", {})
+
+    rec = await enrich_record(Record(title="T", doi_norm="10.1/early"), clients={}, early_exit=True)
+
+    assert (rec.abstract_text, rec.abstract_source) == ("found", "openalex")
+    assert [c for c in called if c != "fetch_unpaywall"] == ["crossref", "openalex"]
+    assert {"crossref", "openalex"} <= set(rec.provenance)
+    assert not {"epmc", "pubmed"} & set(rec.provenance)
+
+
+async def test_enrich_records_bounds_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    active = peak = 0
+
+    async def fake_enrich(rec: Record, *args: Any) -> Record:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return rec
+
+    async def no_prefetch(records: list[Record]) -> dict[str, Any]:
+        return {}
+
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.enrich_record", fake_enrich)
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.prefetch_batch_sources", no_prefetch)
+    recs = [Record(title=str(i)) for i in range(6)]
+
+    assert await enrich_records(recs, clients={}, max_concurrency=2) == recs
+    assert peak == 2
+
+
+def test_abstract_sources_resolve_fetchers_at_call_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert all(callable(source.fetcher) for source in ABSTRACT_SOURCES)
+
+    async def patched(rec: Record) -> tuple[None, None]:
+        return None, None
+
+    monkeypatch.setattr("llm_query_doc_analyser.enrich.orchestrator.fetch_crossref", patched)
+    assert next(s for s in ABSTRACT_SOURCES if s.key == "crossref").fetcher is patched
+
+
+def test_extract_arxiv_id() -> None:
+    rec = Record(title="T", doi_norm="arxiv:2101.00001v2")
+    extract_arxiv_id(rec)
+    assert rec.arxiv_id == "2101.00001"
+
+
+def test_abstract_from_inverted_index() -> None:
+    assert _abstract_from_inverted_index({"a": [0, 2], "b": [1]}, None) == "a b a"
+    # Gaps beyond the position count are skipped
+    assert _abstract_from_inverted_index({"a": [0, 5], "b": [1]}, None) == "a b a"
+    assert _abstract_from_inverted_index({"a": []}, None) is None
+
+
 def test_format_enrichment_report() -> None:
     """Test the enrichment report formatting function."""
     rec = Record(
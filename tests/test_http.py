@@ -0,0 +1,31 @@
+"""Tests for the retry backoff used by get_with_retry."""
+
+import httpx
+from tenacity import RetryCallState
+
+from llm_query_doc_analyser.utils.http import wait_retry_after
+
+
+def _state_after(exc: BaseException) -> RetryCallState:
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs={})  # type: ignore[arg-type]
+    state.set_exception((type(exc), exc, None))
+    return state
+
+
+def _status_error(status: int, headers: dict[str, str]) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.org")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_wait_retry_after_honours_server_delay() -> None:
+    assert wait_retry_after(_state_after(_status_error(429, {"Retry-After": "7"}))) == 7.0
+    # Capped so a misbehaving server cannot stall the run
+    assert wait_retry_after(_state_after(_status_error(503, {"Retry-After": "3600"}))) == 60.0
+
+
+def test_wait_retry_after_falls_back_to_exponential_backoff() -> None:
+    # HTTP-date values and network errors use the exponential schedule (min 2s)
+    date_header = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert wait_retry_after(_state_after(_status_error(429, date_header))) >= 2.0
+    assert wait_retry_after(_state_after(httpx.ConnectError("down"))) >= 2.0
@@ -6,7 +6,7 @@ from typing import Any
 
 import pytest
 
-from llm_query_doc_analyser.core.store import get_records, init_db, upsert_record
+from llm_query_doc_analyser.core.store import close_conn, get_records, init_db, upsert_record
 from llm_query_doc_analyser.io_.load import load_records
 
 SAMPLE_XLSX = Path("docs/sample_import_example.xlsx")
@@ -18,6 +18,7 @@ def temp_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[Path,
     monkeypatch.setattr("llm_query_doc_analyser.core.store.DB_PATH", db_path)
     init_db()
     yield db_path
+    close_conn()
     # Optional: ensure no pending WAL and nuke any lingering refs.
     try:
         with sqlite3.connect(db_path) as conn:
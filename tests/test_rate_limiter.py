@@ -139,3 +139,45 @@ async def test_rate_limiter_lazy_lock_initialization() -> None:
     lock_ref = limiter._lock
     await limiter.acquire()
     assert limiter._lock is lock_ref
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_bursts_up_to_capacity() -> None:
+    """A full bucket lets `burst` calls through at once, then falls back to the rate."""
+    limiter = RateLimiter(calls_per_second=5.0, burst=3)
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    assert time.monotonic() - start < 0.1, "Burst should not be throttled"
+
+    await limiter.acquire()
+    elapsed = time.monotonic() - start
+    assert 0.15 <= elapsed < 0.35, f"Call after burst not paced: {elapsed}s"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_back_to_back_calls_within_burst_do_not_wait() -> None:
+    limiter = RateLimiter(calls_per_second=5.0, burst=5)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_refunds_cancelled_waiters() -> None:
+    """A caller cancelled while waiting must not delay the callers after it."""
+    limiter = RateLimiter(calls_per_second=10.0)  # 0.1s interval
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    start = time.monotonic()
+    await limiter.acquire()
+    elapsed = time.monotonic() - start
+    assert elapsed < 0.15, f"Cancelled reservation was not refunded: {elapsed}s"
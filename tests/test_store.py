@@ -0,0 +1,250 @@
+# tests/test_store.py
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from llm_query_doc_analyser.core.models import Record
+from llm_query_doc_analyser.core.store import (
+    _thread_conn,
+    batch_insert_filtering_results,
+    bulk_ingest_mode,
+    close_conn,
+    create_article_version_relation,
+    create_filtering_query,
+    filter_already_downloaded_records,
+    filter_unresolved_records,
+    flush_filtering_batch,
+    get_conn,
+    get_filtering_results,
+    get_matched_records_by_filtering_query,
+    get_preprint_version_id,
+    get_published_version_id,
+    get_record_by_doi,
+    get_record_id_by_doi,
+    get_records,
+    get_resolved_candidates,
+    init_db,
+    insert_pdf_resolution,
+    insert_pdf_resolutions,
+    insert_record,
+    insert_records,
+    record_pdf_download_attempt,
+    record_pdf_download_attempts,
+    update_enrichment_records,
+    upsert_record,
+    upsert_records,
+)
+
+
+@pytest.fixture
+def temp_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[Path, Any, None]:
+    db_path = tmp_path / "test_store.db"
+    monkeypatch.setattr("llm_query_doc_analyser.core.store.DB_PATH", db_path)
+    init_db()
+    yield db_path
+    close_conn()
+
+
+def _insert(doi: str) -> int:
+    return insert_record(Record(title=f"Title {doi}", doi_raw=doi, doi_norm=doi))
+
+
+def test_matched_records_exclude_errors_and_warnings(temp_db: Path) -> None:
+    ok_id = _insert("10.1/ok")
+    err_id = _insert("10.1/err")
+    warn_id = _insert("10.1/warn")
+    miss_id = _insert("10.1/miss")
+    ts = "2025-01-01T00:00:00"
+    fq_id = create_filtering_query(ts, "q", "", "model", 1)
+    assert fq_id is not None
+
+    batch_insert_filtering_results(
+        [
+            (ok_id, fq_id, True, "relevant", ts),
+            (err_id, fq_id, True, "ERROR: api failure", ts),
+            (warn_id, fq_id, True, "WARNING: no explanation", ts),
+            (miss_id, fq_id, False, "not relevant", ts),
+        ]
+    )
+
+    matched = get_matched_records_by_filtering_query(fq_id)
+    assert [rec.id for rec in matched] == [ok_id]
+    assert {r["timestamp"] for r in get_filtering_results(fq_id)} == {ts}
+
+
+def test_get_record_id_by_doi_sees_records_inserted_after_a_miss(temp_db: Path) -> None:
+    assert get_record_id_by_doi("10.1/later") is None
+    rec_id = _insert("10.1/later")
+    assert get_record_id_by_doi("10.1/later") == rec_id
+    # Second lookup is served from the cache
+    assert get_record_id_by_doi("10.1/later") == rec_id
+
+
+def test_upsert_record_updates_existing_doi_in_place(temp_db: Path) -> None:
+    first_id = upsert_record(Record(title="Old", doi_raw="10.1/up", doi_norm="10.1/up"))
+    second_id = upsert_record(Record(title="New", doi_raw="10.1/up", doi_norm="10.1/up"))
+    assert first_id is not None
+    assert second_id == first_id
+    # An unchanged re-upsert skips the write but still returns the id
+    assert upsert_record(Record(title="New", doi_raw="10.1/up", doi_norm="10.1/up")) == first_id
+    assert [rec.title for rec in get_records()] == ["New"]
+    rec = get_record_by_doi("10.1/up")
+    assert rec is not None and (rec.id, rec.title) == (first_id, "New")
+    assert get_record_by_doi("10.1/missing") is None
+
+
+def test_records_round_trip_booleans_and_provenance(temp_db: Path) -> None:
+    insert_record(
+        Record(title="B", doi_norm="10.1/b", is_oa=True, is_preprint=False, provenance={"s2": {"n": 1}})
+    )
+    rec = get_record_by_doi("10.1/b")
+    assert rec is not None
+    assert (rec.is_oa, rec.is_preprint, rec.provenance) == (True, False, {"s2": {"n": 1}})
+    assert [r.is_oa for r in get_records()] == [True]
+
+
+def test_upsert_records_inserts_new_and_updates_existing(temp_db: Path) -> None:
+    existing_id = _insert("10.1/old")
+    upserted = upsert_records(
+        [Record(title="Updated", doi_norm="10.1/old"), Record(title="Fresh", doi_norm="10.1/new")]
+    )
+    assert upserted == 2
+    assert get_record_id_by_doi("10.1/old") == existing_id
+    assert sorted(rec.title for rec in get_records()) == ["Fresh", "Updated"]
+
+
+def test_update_enrichment_records_updates_by_doi(temp_db: Path) -> None:
+    _insert("10.1/e1")
+    _insert("10.1/e2")
+    updated = update_enrichment_records(
+        [
+            Record(title="x", doi_norm="10.1/e1", abstract_text="one", enrichment_datetime="t"),
+            Record(title="x", doi_norm="10.1/e2", abstract_text="two", enrichment_datetime="t"),
+            Record(title="x", doi_norm="10.1/absent", abstract_text="none"),
+        ]
+    )
+    assert updated == 2
+    assert sorted(rec.abstract_text or "" for rec in get_records()) == ["one", "two"]
+
+
+def test_insert_records_skips_duplicate_dois(temp_db: Path) -> None:
+    _insert("10.1/existing")
+    skipped = insert_records(
+        [
+            Record(title="A", doi_norm="10.1/a"),
+            Record(title="Dup in batch", doi_norm="10.1/a"),
+            Record(title="Dup in db", doi_norm="10.1/existing"),
+            Record(title="No DOI"),
+        ]
+    )
+    assert [rec.title for rec in skipped] == ["Dup in batch", "Dup in db"]
+    assert sorted(rec.title for rec in get_records()) == ["A", "No DOI", "Title 10.1/existing"]
+
+
+def test_bulk_ingest_mode_restores_wal(temp_db: Path) -> None:
+    assert get_records() == []  # opens this thread's read-only connection
+    with bulk_ingest_mode():
+        with get_conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert insert_records([Record(title="Bulk", doi_norm="10.1/bulk")]) == []
+    with get_conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert get_record_id_by_doi("10.1/bulk") is not None
+
+
+def test_bulk_ingest_mode_rolls_back_a_failed_import(temp_db: Path) -> None:
+    with pytest.raises(RuntimeError), bulk_ingest_mode():
+        # A write still pending when the import fails
+        _thread_conn().execute(
+            "INSERT INTO research_articles (title, doi_norm) VALUES ('x', '10.1/x')"
+        )
+        raise RuntimeError("import failed")
+    assert get_records() == []
+    with get_conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_new_database_uses_8k_pages(temp_db: Path) -> None:
+    close_conn()  # reopening an existing database must keep its page size
+    with get_conn() as conn:
+        assert conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+
+
+def test_flush_filtering_batch_writes_results_and_stats(temp_db: Path) -> None:
+    rec_id = _insert("10.1/flush")
+    fq_id = create_filtering_query("2025-01-01T00:00:00", "q", "", "model", 1)
+    assert fq_id is not None
+
+    flush_filtering_batch(
+        fq_id,
+        [(rec_id, fq_id, True, "relevant", "2025-01-01T00:00:00")],
+        total_records=1,
+        matched_count=1,
+        failed_count=0,
+    )
+
+    assert [r["id"] for r in get_filtering_results(fq_id)] == [rec_id]
+    with get_conn() as conn:
+        stats = conn.execute(
+            "SELECT total_records, matched_count, failed_count FROM filtering_queries WHERE id = ?",
+            (fq_id,),
+        ).fetchone()
+    assert stats == (1, 1, 0)
+
+
+def test_filters_batch_lookups_across_chunks(
+    temp_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("llm_query_doc_analyser.core.store._IN_CHUNK_SIZE", 2)
+    ids = [_insert(f"10.1/f{i}") for i in range(5)]
+    ts = "2025-01-01T00:00:00"
+    insert_pdf_resolution(ids[0], [{"url": "https://example.org/a.pdf"}], ts)
+    insert_pdf_resolution(ids[3], [], ts)  # empty candidates are re-resolved
+    insert_pdf_resolution(ids[2], [], ts)
+    with get_conn() as conn:  # invalid JSON is treated as unresolved
+        conn.execute("UPDATE pdf_resolutions SET candidates = '[{' WHERE record_id = ?", (ids[2],))
+    record_pdf_download_attempt(ids[1], "https://example.org/b.pdf", "arxiv", "downloaded", ts)
+    record_pdf_download_attempt(ids[4], "https://example.org/c.pdf", "arxiv", "error", ts)
+    records = get_records()
+
+    assert [r.id for r in filter_unresolved_records(records)] == [ids[1], ids[2], ids[3], ids[4]]
+    assert [r.id for r in filter_already_downloaded_records(records)] == [
+        ids[0],
+        ids[2],
+        ids[3],
+        ids[4],
+    ]
+
+
+def test_batched_resolution_and_download_writes_upsert_per_record(temp_db: Path) -> None:
+    rec_id = _insert("10.1/batch")
+    insert_pdf_resolutions([(rec_id, [], "t1")])
+    insert_pdf_resolutions([(rec_id, [{"url": "u"}], "t2")])
+    assert get_resolved_candidates(rec_id) == [{"url": "u"}]
+
+    record_pdf_download_attempts([(rec_id, "u", "arxiv", "error", "t1", None, None, None, "boom")])
+    record_pdf_download_attempts(
+        [(rec_id, "u", "arxiv", "downloaded", "t2", "a.pdf", "abc", None, None)]
+    )
+    with get_conn() as conn:
+        rows = conn.execute(
+            "SELECT status, pdf_local_path, error_message FROM pdf_downloads"
+        ).fetchall()
+    assert rows == [("downloaded", "a.pdf", None)]
+
+
+def test_version_id_lookups_see_relations_created_after_a_miss(temp_db: Path) -> None:
+    preprint_id = _insert("10.1/pre")
+    published_id = _insert("10.1/pub")
+    assert get_published_version_id(preprint_id) is None
+
+    relation_id = create_article_version_relation(preprint_id, published_id, "crossref")
+    assert relation_id is not None
+    assert create_article_version_relation(preprint_id, published_id, "openalex") == relation_id
+    assert get_published_version_id(preprint_id) == published_id
+    assert get_preprint_version_id(published_id) == preprint_id
+    # Served from the cache
+    assert get_published_version_id(preprint_id) == published_id